@@ -8,6 +8,7 @@ from typing import Self, Unpack
 
 import aiohttp
 import aiohttp.typedefs
+from multidict import CIMultiDict
 
 from .api_models import ApiResult, Layer, ServerStatus, VoteMapUserConfig
 from .api_request_context import ApiRequestContext, ApiRequestParams
@@ -15,6 +16,8 @@ from .converters import make_rcon_converter
 from .exceptions import ApiClientError
 from .server_connection_details import ServerConnectionDetails
 
+_RCON_CONVERTER = make_rcon_converter()
+
 
 class ApiClient(AbstractAsyncContextManager):
     """A client for the CRCON API.
@@ -23,28 +26,41 @@ class ApiClient(AbstractAsyncContextManager):
     interface.
     """
 
-    def __init__(self, crcon_details: ServerConnectionDetails, loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        crcon_details: ServerConnectionDetails,
+        loop: asyncio.AbstractEventLoop,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize the client.
 
         Args:
             crcon_details (ServerCRCONDetails): The server configuration.
             loop (asyncio.AbstractEventLoop): The event loop to use for the client.
+            session (aiohttp.ClientSession | None, optional): A session shared between clients, which the client uses
+            but does not close. If not specified, the client creates its own session when its context is entered and
+            closes it on exit. Defaults to None.
         """
         self._crcon_details = crcon_details
         self._loop = loop
         self._exit_stack = AsyncExitStack()
+        self._shared_session = session
         self._session: aiohttp.ClientSession | None = None
-        self._converter = make_rcon_converter()
+        self._converter = _RCON_CONVERTER
+
+        # The headers are sent with each request rather than set on the session, so that the session can be shared
+        # between servers
+        self._headers = {"Authorization": f"BEARER {self._crcon_details.api_key}"}
+        if self._crcon_details.rcon_headers:
+            self._headers.update(self._crcon_details.rcon_headers)
 
     async def __aenter__(self) -> Self:
         """Enter the context manager and set up the client."""
         await self._exit_stack.__aenter__()
-        headers = {"Authorization": f"BEARER {self._crcon_details.api_key}"}
-        if self._crcon_details.rcon_headers:
-            headers.update(self._crcon_details.rcon_headers)
-        self._session = await self._exit_stack.enter_async_context(
-            aiohttp.ClientSession(loop=self._loop, headers=headers),
-        )
+        if self._shared_session:
+            self._session = self._shared_session
+        else:
+            self._session = await self._exit_stack.enter_async_context(aiohttp.ClientSession(loop=self._loop))
         return self
 
     async def __aexit__(
@@ -182,6 +198,13 @@ class ApiClient(AbstractAsyncContextManager):
         if not self._session:
             raise RuntimeError("CRCONApiClient context must be entered")
 
+        # Headers passed by the caller are sent as well, and take precedence over the client's own
+        if headers := kwargs.get("headers"):
+            merged_headers = CIMultiDict(self._headers)
+            merged_headers.update(headers)
+            kwargs["headers"] = merged_headers
+        else:
+            kwargs["headers"] = self._headers
         params = ApiRequestParams(
             method=method,
             url=self._crcon_details.api_url / endpoint,
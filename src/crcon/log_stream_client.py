@@ -20,13 +20,15 @@ from websockets.asyncio.client import (
 
 from utils import backoff
 
-from .api_models import LogMessageType, LogStreamObject, LogStreamResponse
+from .api_models import LogMessageType, LogStreamObject
 from .converters import make_rcon_converter
 from .exceptions import LogStreamMessageError, WebsocketConnectionError
 from .server_connection_details import ServerConnectionDetails
 
 logger = logging.getLogger(__name__)
 
+_RCON_CONVERTER = make_rcon_converter()
+
 
 @frozen(kw_only=True)
 class LogStreamClientSettings:
@@ -65,7 +67,7 @@ class LogStreamClient:
         self.websocket_url = self._crcon_details.websocket_url / "ws/logs"
         self.last_seen_id: str | None = None
         self._first_connection = True
-        self._converter = make_rcon_converter()
+        self._converter = _RCON_CONVERTER
         self._exit_stack = contextlib.AsyncExitStack()
 
     async def __aenter__(self) -> Self:
@@ -82,6 +84,31 @@ class LogStreamClient:
         """Closes the connection to the CRCON server."""
         return await self._exit_stack.__aexit__(exc_t, exc_v, exc_tb)
 
+    @classmethod
+    def drain(cls, queue: asyncio.Queue[LogStreamObject], max_items: int = 64) -> list[LogStreamObject]:
+        """Removes up to `max_items` log messages from the queue without waiting.
+
+        This is the preferred way for consumers to read from the queue once they have been woken by a message, because
+        it lets them process a burst of log messages as a batch rather than paying for a context switch per message.
+        The caller is responsible for calling `queue.task_done()` for each message returned. A queue that has been shut
+        down is treated as empty, so that the caller's next wait on the queue is the one that raises `QueueShutDown`.
+
+        Args:
+            queue (asyncio.Queue[LogStreamObject]): The queue to drain.
+            max_items (int, optional): The maximum number of messages to remove. Defaults to 64.
+
+        Returns:
+            list[LogStreamObject]: The messages removed from the queue, in the order they were received. Empty if the
+            queue was empty.
+        """
+        items: list[LogStreamObject] = []
+        while len(items) < max_items:
+            try:
+                items.append(queue.get_nowait())
+            except (asyncio.QueueEmpty, asyncio.QueueShutDown):
+                break
+        return items
+
     async def run(self) -> None:
         """Continually reads the log stream from a CRCON server.
 
@@ -202,16 +229,25 @@ class LogStreamClient:
     async def _handle_incoming_message(self, message: websockets.Data) -> None:
         try:
             obj = json.loads(message)
-            response = self._converter.structure(obj, LogStreamResponse)
-            if response:
-                if response.error:
-                    logger.debug("Response message error: %s", response.error)
-                    raise LogStreamMessageError(response.error)
-
-                self.last_seen_id = response.last_seen_id
-                logs_bundle = response.logs
-                # do stuff with the logs
-                for log in logs_bundle:
+            # Inspect the raw response rather than structuring a `LogStreamResponse`, because most messages carry no
+            # logs and only the last seen ID needs to be recorded
+            error = obj.get("error")
+            if error:
+                logger.debug("Response message error: %s", error)
+                raise LogStreamMessageError(error)
+
+            raw_logs = obj.get("logs")
+            if not raw_logs:
+                self.last_seen_id = obj.get("last_seen_id")
+                return
+
+            logs_bundle = self._converter.structure(raw_logs, list[LogStreamObject])
+            self.last_seen_id = obj.get("last_seen_id")
+            for log in logs_bundle:
+                # Only yield to the event loop when the queue is full
+                try:
+                    self._queue.put_nowait(log)
+                except asyncio.QueueFull:
                     await self._queue.put(log)
 
         except LogStreamMessageError:
@@ -11,10 +11,12 @@ import uvloop
 from dotenv import load_dotenv
 
 from polebot.orchestrator import Orchestrator
+from utils import eager_task_factory
 from utils.log_tools import configure_logger
 
 from .app_config import AppConfig
 from .composition_root import (
+    close_container,
     init_container,
 )
 
@@ -46,8 +48,11 @@ async def async_main(loop: asyncio.AbstractEventLoop) -> None:
     cfg = environ.to_config(AppConfig)
     container = await init_container(app_config=cfg, loop=loop)
 
-    orchestrator_instance = container[Orchestrator]
-    await orchestrator_instance.run()
+    try:
+        orchestrator_instance = container[Orchestrator]
+        await orchestrator_instance.run()
+    finally:
+        await close_container(container)
 
 
 def main() -> None:
@@ -55,6 +60,8 @@ def main() -> None:
     global _loop
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     _loop = asyncio.new_event_loop()
+    # Tasks that finish without suspending, such as cache hits, then complete without a trip through the event loop
+    _loop.set_task_factory(eager_task_factory)
 
     _loop.add_signal_handler(signal.SIGINT, lambda: shutdown(signal.SIGINT))
     _loop.add_signal_handler(signal.SIGTERM, lambda: shutdown(signal.SIGTERM))
@@ -20,5 +20,17 @@ class AppConfig:
 
         connection_string: str = environ.var(help="The connection string for MongoDB.")
         db_name: str = environ.var("The name of the database to use in MongoDB.")
+        max_pool_size: int = environ.var(
+            50, converter=int, help="The maximum number of connections in the MongoDB connection pool.",
+        )
+        min_pool_size: int = environ.var(
+            10, converter=int, help="The number of connections the MongoDB connection pool keeps open when idle.",
+        )
+        wait_queue_timeout_ms: int = environ.var(
+            5000, converter=int, help="How long an operation waits for a free pooled connection, in milliseconds.",
+        )
+        server_selection_timeout_ms: int = environ.var(
+            30000, converter=int, help="How long to wait for a suitable MongoDB server, in milliseconds.",
+        )
 
     mongodb: MongoConfig = environ.group(MongoConfig)
@@ -5,13 +5,15 @@ from collections.abc import Iterable
 from contextlib import AbstractContextManager
 from typing import TypeVar
 
+import aiohttp
 from lagom import (
     Container,
     ContextContainer,
     context_dependency_definition,
     dependency_definition,
 )
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from typeguard import TypeCheckError, check_type
 
 from crcon import ApiClient, LogStreamClient, LogStreamClientSettings
@@ -53,10 +55,13 @@ def define_context_dependency(ctr: Container, dep_type: type[X]) -> None:
 
 _container = Container()
 
+_HTTP_CONNECTION_LIMIT = 100
+_HTTP_DNS_CACHE_TTL = 300
+
 _container_initialized = False
 
 
-async def create_polebot_database(app_config: AppConfig, mongo_db: AsyncIOMotorDatabase) -> PolebotDatabase:
+async def create_polebot_database(app_config: AppConfig, mongo_db: AsyncDatabase) -> PolebotDatabase:
     db = PolebotDatabase(app_config, mongo_db)
     await db.initialize()
     return db
@@ -80,11 +85,24 @@ async def init_container(app_config: AppConfig, loop: asyncio.AbstractEventLoop)
     # *** SINGLETON ***
     _container[ContainerProvider] = ContainerProvider(_container)
     _container[AppConfig] = app_config
-    mongo_client: AsyncIOMotorClient = AsyncIOMotorClient(app_config.mongodb.connection_string, tz_aware=True)
-    mongo_db: AsyncIOMotorDatabase = mongo_client[app_config.mongodb.db_name]
-    _container[AsyncIOMotorClient] = mongo_client
-    _container[AsyncIOMotorDatabase] = mongo_db
+    mongo_client: AsyncMongoClient = AsyncMongoClient(
+        app_config.mongodb.connection_string,
+        tz_aware=True,
+        maxPoolSize=app_config.mongodb.max_pool_size,
+        minPoolSize=app_config.mongodb.min_pool_size,
+        waitQueueTimeoutMS=app_config.mongodb.wait_queue_timeout_ms,
+        serverSelectionTimeoutMS=app_config.mongodb.server_selection_timeout_ms,
+    )
+    mongo_db: AsyncDatabase = mongo_client[app_config.mongodb.db_name]
+    _container[AsyncMongoClient] = mongo_client
+    _container[AsyncDatabase] = mongo_db
     _container[PolebotDatabase] = await create_polebot_database(app_config, mongo_db)
+    # One HTTP session for all CRCON API clients, so that connections and DNS lookups are reused across servers and
+    # across connection checks for new servers
+    _container[aiohttp.ClientSession] = aiohttp.ClientSession(
+        loop=loop,
+        connector=aiohttp.TCPConnector(limit=_HTTP_CONNECTION_LIMIT, ttl_dns_cache=_HTTP_DNS_CACHE_TTL),
+    )
 
     @dependency_definition(_container, singleton=True)
     def _get_event_loop() -> asyncio.AbstractEventLoop:
@@ -108,6 +126,16 @@ async def init_container(app_config: AppConfig, loop: asyncio.AbstractEventLoop)
     return _container
 
 
+async def close_container(container: Container) -> None:
+    """Releases the resources held by the dependency injection container's singletons.
+
+    Args:
+        container (Container): The container to close.
+    """
+    await container[aiohttp.ClientSession].close()
+    await container[AsyncMongoClient].close()
+
+
 _QUEUE_SIZE = 1000
 
 
@@ -12,7 +12,6 @@ from polebot.composition_root import create_api_client
 from polebot.discord.bot import Polebot
 from polebot.exceptions import DatastoreError
 from polebot.orchestrator import OrchestrationError
-from polebot.services import cattrs_helpers
 from utils import is_absolute
 
 from ..discord_utils import (
@@ -93,8 +92,6 @@ class Servers(commands.GroupCog, name="servers", description="Manage your CRCON
         self.bot = bot
         self._orchestrator = self.bot.orchestrator
 
-        self._converter = cattrs_helpers.make_params_converter()
-
     @app_commands.command(name="list", description="List your servers")
     @app_commands.guild_only()
     async def list_servers(self, interaction: Interaction) -> None:
@@ -220,11 +220,9 @@ async def get_autocomplete_servers(
         return []
 
     await interaction.response.defer()
-    guild_servers = await orchestrator.get_guild_servers(interaction.guild_id)
+    server_names = await orchestrator.get_guild_server_names(interaction.guild_id)
     choices = [
-        app_commands.Choice(name=server.name, value=server.label)
-        for server in guild_servers
-        if current.lower() in server.name.lower() and server.id
+        app_commands.Choice(name=name, value=label) for label, name in server_names if current.lower() in name.lower()
     ]
     return choices
 
@@ -3,7 +3,9 @@ import json
 import logging
 from collections.abc import Iterable
 
+import cachetools
 from aiohttp import ClientConnectorDNSError, ContentTypeError
+from attrs import evolve
 from bson import ObjectId
 from lagom import Container
 
@@ -24,6 +26,14 @@ from .services.server_controller import ServerController
 
 _logger = logging.getLogger(__name__)
 
+_PARAMS_CONVERTER = cattrs_helpers.make_params_converter()
+_SETTINGS_JSON_ENCODER = json.JSONEncoder(indent=4)
+_LOOKUP_CACHE_SIZE = 256
+_LOOKUP_CACHE_TTL = 30
+
+_GuildServerCache = cachetools.TTLCache[tuple[int, str], GuildServer]
+_PlayerGroupCache = cachetools.TTLCache[tuple[int, str], GuildPlayerGroup]
+
 
 class OrchestrationError(Exception):
     """Exception raised by the orchestrator."""
@@ -53,27 +63,49 @@ class Orchestrator:
         self._app_config = app_config
         self._logger = logger or _logger
 
-        self._converter = cattrs_helpers.make_params_converter()
+        self._converter = _PARAMS_CONVERTER
         self._bot = make_bot(self, self._container_provider.container, self._app_config.discord_owner_id)
         self._tg = asyncio.TaskGroup()
         self._db = container_provider.container[PolebotDatabase]
         self._settings_loader = SettingsLoader()
         self._server_controllers: dict[ObjectId, ServerController] = {}
+        # Serialized votemap settings for download, keyed by server ID and tagged with the document version they were
+        # generated from
+        self._votemap_settings_json: dict[ObjectId, tuple[int, str]] = {}
+        # Short-lived caches of servers and player groups by (guild ID, label); evicted on every write to the document
+        self._guild_server_cache: _GuildServerCache = _GuildServerCache(
+            maxsize=_LOOKUP_CACHE_SIZE,
+            ttl=_LOOKUP_CACHE_TTL,
+        )
+        self._player_group_cache: _PlayerGroupCache = _PlayerGroupCache(
+            maxsize=_LOOKUP_CACHE_SIZE,
+            ttl=_LOOKUP_CACHE_TTL,
+        )
 
     async def run(self) -> None:
         self._logger.info("Orchestrator started")
 
-        servers = await self._get_servers()
-
         async with self._tg:
             self._tg.create_task(self._run_polebot(), name="polebot")
-            for server in servers:
+            # Start each server controller as soon as its document is read, rather than waiting for the full list
+            async for server in self._db.iter_all(GuildServer, None):
                 self._start_server_controller(server)
 
         self._logger.info("Orchestrator stopped")
 
     async def add_guild_server(self, guild_id: int, label: str, crcon_details: ServerConnectionDetails) -> str:
-        result = await self._attempt_connect_to_server(crcon_details)
+        # Probe the server while checking for a duplicate label, and abandon the probe if the label is already taken
+        probe = asyncio.create_task(self._attempt_connect_to_server(crcon_details))
+        try:
+            existing = await self._find_guild_server(guild_id, label)
+        except BaseException:
+            probe.cancel()
+            raise
+        if existing:
+            probe.cancel()
+            raise OrchestrationError(f"A server labelled '{label}' already exists.")
+
+        result = await probe
         if not result[0]:
             message = f"Unable to connect to the server with the details provided: {result[1]}"
             raise OrchestrationError(message)
@@ -96,15 +128,10 @@ class Orchestrator:
             return server_name
 
     async def remove_guild_server(self, guild_id: int, label: str) -> None:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=label,
-        )
+        guild_server = await self._find_guild_server(guild_id, label)
         if guild_server:
             try:
-                await self._delete_and_stop_server(guild_server.id)
+                await self._delete_and_stop_server(guild_server)
             except DatastoreError as ex:
                 self._logger.error("Error removing server", exc_info=ex)
                 raise OrchestrationError(f"Unable to remove server {label}.") from None
@@ -114,31 +141,31 @@ class Orchestrator:
     async def get_guild_servers(self, guild_id: int) -> list[GuildServer]:
         return await self.db.fetch_all(GuildServer, guild_id, sort="label")
 
+    async def get_guild_server_names(self, guild_id: int) -> list[tuple[str, str]]:
+        docs = await self.db.fetch_fields(GuildServer, guild_id, ["label", "name"])
+        return [(doc["label"], doc["name"]) for doc in docs]
+
     async def get_guild_server(self, guild_id: int, label: str) -> GuildServer | None:
-        return await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=label,
-        )
+        return await self._find_guild_server(guild_id, label)
 
     async def get_server_votemap_settings(self, guild_id: int, server_label: str) -> str:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server_label,
-        )
+        guild_server = await self._find_guild_server(guild_id, server_label)
         if not guild_server:
             raise OrchestrationError(f"Server {server_label} not found")
         if not guild_server.weighting_parameters:
             raise OrchestrationError(f"Server {server_label} does not have any votemap settings")
+
+        cached = self._votemap_settings_json.get(guild_server.id)
+        if cached and cached[0] == guild_server.db_version:
+            return cached[1]
         try:
             content = self._converter.unstructure(guild_server.weighting_parameters)
-            json_contents = json.dumps(content, indent=4)
-            return json_contents
+            json_contents = _SETTINGS_JSON_ENCODER.encode(content)
         except UnicodeEncodeError:
             return f"Server {server_label} settings could not be downloaded"
+        else:
+            self._votemap_settings_json[guild_server.id] = (guild_server.db_version, json_contents)
+            return json_contents
 
     async def upload_server_votemap_settings(self, guild_id: int, server_label: str, file_contents: str) -> GuildServer:
         result = self._settings_loader.load_weighting_parameters(file_contents)
@@ -147,23 +174,15 @@ class Orchestrator:
                 "Invalid settings file:\n\n" + "\n\n".join([f"{e.message} at {e.path}" for e in result]),
             )
 
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server_label,
-        )
+        guild_server = await self._find_guild_server(guild_id, server_label)
         if not guild_server:
             raise OrchestrationError(f"No server with label {server_label} found")
 
-        guild_server.weighting_parameters = result
         self._server_controllers[guild_server.id].weighting_parameters = result
-        try:
-            guild_server = await self.db.update(guild_server)
-        except DatastoreError as ex:
-            raise OrchestrationError(f"Unable to save votemap settings for server {server_label}.") from ex
-        else:
-            return guild_server
+        return await self._update_guild_server(
+            evolve(guild_server, weighting_parameters=result),
+            f"Unable to save votemap settings for server {server_label}.",
+        )
 
     async def set_server_votemap_enabled(
         self,
@@ -171,31 +190,26 @@ class Orchestrator:
         server_label: str,
         enabled: bool,
     ) -> tuple[GuildServer, bool]:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server_label,
-        )
+        guild_server = await self._find_guild_server(guild_id, server_label)
         if not guild_server:
             raise OrchestrationError(f"Server {server_label} not found")
         if not guild_server.weighting_parameters:
             raise OrchestrationError(
                 f"Server {server_label} does not have any votemap settings, can't enable votemap bot",
             )
-        try:
-            if guild_server.enable_votemap != enabled:
-                self._server_controllers[guild_server.id].votemap_enabled = enabled
-                guild_server.enable_votemap = enabled
-                guild_server = await self.db.update(guild_server)
-                self._logger.info(
-                    "Votemap bot %s for server %s",
-                    "enabled" if enabled else "disabled",
-                    guild_server.id,
-                )
-            return (guild_server, guild_server.enable_votemap != enabled)
-        except DatastoreError as ex:
-            raise OrchestrationError(f"Unable to save changes for server {server_label}.") from ex
+        if guild_server.enable_votemap == enabled:
+            return (guild_server, False)
+        self._server_controllers[guild_server.id].votemap_enabled = enabled
+        guild_server = await self._update_guild_server(
+            evolve(guild_server, enable_votemap=enabled),
+            f"Unable to save changes for server {server_label}.",
+        )
+        self._logger.info(
+            "Votemap bot %s for server %s",
+            "enabled" if enabled else "disabled",
+            guild_server.id,
+        )
+        return (guild_server, True)
 
     async def get_player_groups(self, guild_id: int) -> list[GuildPlayerGroup]:
         return await self.db.fetch_all(GuildPlayerGroup, guild_id, sort="label")
@@ -217,14 +231,10 @@ class Orchestrator:
         return player_group
 
     async def remove_player_group(self, guild_id: int, label: str) -> None:
-        player_group = await self.db.find_one(
-            GuildPlayerGroup,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=label,
-        )
+        player_group = await self._find_player_group(guild_id, label)
         if player_group:
             try:
+                self._evict_player_group(player_group)
                 await self.db.delete(GuildPlayerGroup, player_group.id)
                 self._logger.info("Player group %s removed", player_group.id)
             except DatastoreError as ex:
@@ -240,21 +250,12 @@ class Orchestrator:
         group: str,
         message: str,
     ) -> Iterable[PlayerProperties]:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server,
+        guild_server, player_group = await asyncio.gather(
+            self._find_guild_server(guild_id, server),
+            self._find_player_group(guild_id, group),
         )
         if not guild_server:
             raise OrchestrationError(f"Server {server} not found")
-
-        player_group = await self.db.find_one(
-            GuildPlayerGroup,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=group,
-        )
         if not player_group:
             raise OrchestrationError(f"Player group {group} not found")
         server_controller = self._server_controllers.get(guild_server.id)
@@ -266,21 +267,12 @@ class Orchestrator:
         return players
 
     async def get_players_in_group(self, guild_id: int, server: str, group: str) -> Iterable[PlayerProperties]:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server,
+        guild_server, player_group = await asyncio.gather(
+            self._find_guild_server(guild_id, server),
+            self._find_player_group(guild_id, group),
         )
         if not guild_server:
             raise OrchestrationError(f"Server {server} not found")
-
-        player_group = await self.db.find_one(
-            GuildPlayerGroup,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=group,
-        )
         if not player_group:
             raise OrchestrationError(f"Player group {group} not found")
         server_controller = self._server_controllers.get(guild_server.id)
@@ -292,12 +284,7 @@ class Orchestrator:
         return players
 
     async def get_player_vip_info(self, guild_id: int, server_label: str, player_name: str) -> VipInfo | None:
-        guild_server = await self.db.find_one(
-            GuildServer,
-            guild_id=guild_id,
-            attr_name="label",
-            attr_value=server_label,
-        )
+        guild_server = await self._find_guild_server(guild_id, server_label)
         if not guild_server:
             raise OrchestrationError(f"Server {server_label} not found")
         return await self._server_controllers[guild_server.id].get_player_vip_info(player_name)
@@ -306,10 +293,11 @@ class Orchestrator:
         try:
             servers = await self.db.fetch_all(GuildServer, guild_id)
             for server in servers:
-                await self._delete_and_stop_server(server.id)
+                await self._delete_and_stop_server(server)
 
             player_groups = await self.db.fetch_all(GuildPlayerGroup, guild_id)
             for player_group in player_groups:
+                self._evict_player_group(player_group)
                 await self.db.delete(GuildPlayerGroup, player_group.id)
         except DatastoreError as ex:
             raise OrchestrationError("Unable to delete guild data") from ex
@@ -317,9 +305,50 @@ class Orchestrator:
     def get_server_count(self) -> int:
         return len(self._server_controllers)
 
-    async def _delete_and_stop_server(self, server_id: ObjectId) -> None:
-        await self._stop_server_controller(server_id)
-        await self.db.delete(GuildServer, server_id)
+    async def _find_guild_server(self, guild_id: int, label: str) -> GuildServer | None:
+        key = (guild_id, label)
+        guild_server = self._guild_server_cache.get(key)
+        if guild_server is None:
+            guild_server = await self.db.find_one(GuildServer, guild_id=guild_id, attr_name="label", attr_value=label)
+            if guild_server:
+                self._guild_server_cache[key] = guild_server
+        return guild_server
+
+    async def _update_guild_server(self, guild_server: GuildServer, error_message: str) -> GuildServer:
+        # Cached servers are shared between callers, so changes are made to a copy that is only cached once it is saved
+        self._evict_guild_server(guild_server)
+        try:
+            guild_server = await self.db.update(guild_server)
+        except DatastoreError as ex:
+            raise OrchestrationError(error_message) from ex
+        self._guild_server_cache[(guild_server.guild_id, guild_server.label)] = guild_server
+        return guild_server
+
+    def _evict_guild_server(self, guild_server: GuildServer) -> None:
+        self._guild_server_cache.pop((guild_server.guild_id, guild_server.label), None)
+        self._votemap_settings_json.pop(guild_server.id, None)
+
+    async def _find_player_group(self, guild_id: int, label: str) -> GuildPlayerGroup | None:
+        key = (guild_id, label)
+        player_group = self._player_group_cache.get(key)
+        if player_group is None:
+            player_group = await self.db.find_one(
+                GuildPlayerGroup,
+                guild_id=guild_id,
+                attr_name="label",
+                attr_value=label,
+            )
+            if player_group:
+                self._player_group_cache[key] = player_group
+        return player_group
+
+    def _evict_player_group(self, player_group: GuildPlayerGroup) -> None:
+        self._player_group_cache.pop((player_group.guild_id, player_group.label), None)
+
+    async def _delete_and_stop_server(self, guild_server: GuildServer) -> None:
+        self._evict_guild_server(guild_server)
+        await self._stop_server_controller(guild_server.id)
+        await self.db.delete(GuildServer, guild_server.id)
 
     def _start_server_controller(self, server: GuildServer) -> None:
         self._tg.create_task(
@@ -366,9 +395,6 @@ class Orchestrator:
     async def _run_polebot(self) -> None:
         await self._bot.start(self._app_config.discord_token)
 
-    async def _get_servers(self) -> list[GuildServer]:
-        return await self._db.fetch_all(GuildServer, None, sort=None)
-
     async def _attempt_connect_to_server(self, crcon_details: ServerConnectionDetails) -> tuple[bool, str]:
         api_client = create_api_client(self._container_provider.container, crcon_details)
         result: tuple[bool, str] = (False, "Oops, an error occurred!")
@@ -1,12 +1,24 @@
 """This module configures the converters for JSON serialization and deserialization."""
 
+from collections.abc import Iterable
 
+from cattrs import BaseConverter
+from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn
 from cattrs.preconf.bson import BsonConverter
 from cattrs.preconf.bson import make_converter as make_bson_converter
 from cattrs.preconf.json import JsonConverter
 from cattrs.preconf.json import make_converter as make_json_converter
 from yarl import URL
 
+from crcon.server_connection_details import ServerConnectionDetails
+
+from ..models import EnvironmentGroup, GuildPlayerGroup, GuildServer, MapGroup, WeightingParameters
+
+# Nested types come before the types that contain them, so that the containing types' hooks are generated against the
+# nested types' registered hooks
+_WEIGHTING_TYPES = (EnvironmentGroup, MapGroup, WeightingParameters)
+_DB_TYPES = (ServerConnectionDetails, *_WEIGHTING_TYPES, GuildServer, GuildPlayerGroup)
+
 
 def make_params_converter() -> JsonConverter:
     """Creates a converter for server parameters.
@@ -15,6 +27,7 @@ def make_params_converter() -> JsonConverter:
         JsonConverter: The JSON converter.
     """
     config_converter = make_json_converter()
+    _register_attrs_hooks(config_converter, _WEIGHTING_TYPES)
     return config_converter
 
 
@@ -26,4 +39,12 @@ def make_db_converter() -> BsonConverter:
     """
     converter = make_bson_converter()
     converter.register_unstructure_hook(URL, lambda u: str(u))
+    _register_attrs_hooks(converter, _DB_TYPES)
     return converter
+
+
+def _register_attrs_hooks(converter: BaseConverter, types: Iterable[type]) -> None:
+    # Generate the hooks up front, rather than lazily on first use
+    for cls in types:
+        converter.register_unstructure_hook(cls, make_dict_unstructure_fn(cls, converter))
+        converter.register_structure_hook(cls, make_dict_structure_fn(cls, converter))
@@ -1,7 +1,10 @@
 """This module contains map selector code."""
 
+from .data_loader import WeightingDataframes, get_weighting_dataframes
 from .selector import MapSelector
 
 __all__ = [
     "MapSelector",
+    "WeightingDataframes",
+    "get_weighting_dataframes",
 ]
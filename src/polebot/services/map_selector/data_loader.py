@@ -1,13 +1,15 @@
 """This module contains functions that load the server configuration and layers into dataframes."""
 
+import functools
+import sys
+
+import numpy as np
 import pandas as pd
 from attrs import define
 
-from crcon.api_models import Layer
+from crcon.api_models import Environment, GameMode, Layer
 from polebot.models import WeightingParameters
 
-from .. import cattrs_helpers
-
 
 @define(kw_only=True)
 class WeightingDataframes:
@@ -25,46 +27,56 @@ def get_weighting_dataframes(weighting_params: WeightingParameters) -> Weighting
     Returns:
         ConfigData: An object that contains the config dataframes.
     """
-    json_converter = cattrs_helpers.make_params_converter()
-    config = json_converter.unstructure(weighting_params)
-
-    df_map_groups = (
-        (
-            pd.DataFrame.from_dict(config["groups"], orient="index")
-            .reset_index(names="group")
-            .explode("maps")
-        )
-        .rename(
-            columns={
-                "maps": "map",
-                "weight": "map_weight",
-                "group": "map_group",
-                "repeat_decay": "map_repeat_decay",
-            },
-        )
-        .set_index("map")
+    # Read the attrs objects directly rather than unstructuring them, and collect one value per map/environment into
+    # column lists so that each frame is built column-wise with its index in place. The column types are given
+    # explicitly so that empty settings still produce typed columns.
+    maps: list[str] = []
+    map_groups: list[str] = []
+    map_weights: list[int] = []
+    map_repeat_decays: list[float] = []
+    for group_name, group in weighting_params.groups.items():
+        for map_id in group.maps:
+            maps.append(map_id)
+            map_groups.append(group_name)
+            map_weights.append(group.weight)
+            map_repeat_decays.append(group.repeat_decay)
+    df_map_groups = pd.DataFrame(
+        {
+            "map_group": np.array(map_groups, dtype=object),
+            "map_weight": np.array(map_weights, dtype=np.int64),
+            "map_repeat_decay": np.array(map_repeat_decays, dtype=np.float64),
+        },
+        index=pd.Index(maps, name="map"),
     )
 
-    df_environments = (
-        (
-            pd.DataFrame.from_dict(config["environments"], orient="index")
-            .reset_index(names="environment")
-            .explode("environments")
-        )
-        .rename(
-            columns={
-                "environment": "environment_category",
-                "environments": "environment",
-                "weight": "environment_weight",
-                "repeat_decay": "environment_repeat_decay",
-            },
-        )
-        .set_index("environment")
+    environments: list[str] = []
+    environment_categories: list[str] = []
+    environment_weights: list[int] = []
+    environment_repeat_decays: list[float] = []
+    for category_name, category in weighting_params.environments.items():
+        for environment in category.environments:
+            environments.append(environment)
+            environment_categories.append(category_name)
+            environment_weights.append(category.weight)
+            environment_repeat_decays.append(category.repeat_decay)
+    df_environments = pd.DataFrame(
+        {
+            "environment_category": np.array(environment_categories, dtype=object),
+            "environment_weight": np.array(environment_weights, dtype=np.int64),
+            "environment_repeat_decay": np.array(environment_repeat_decays, dtype=np.float64),
+        },
+        index=pd.Index(environments, name="environment"),
     )
 
     return WeightingDataframes(df_map_groups=df_map_groups, df_environments=df_environments)
 
 
+# Layers are structured into these enums, so their members are the complete set of categories. Using a fixed dtype
+# saves inferring the categories from the values.
+_GAME_MODE_DTYPE = pd.CategoricalDtype(list(GameMode))
+_ENVIRONMENT_DTYPE = pd.CategoricalDtype(list(Environment))
+
+
 @define(kw_only=True)
 class LayerData:
     """Dataframes that represent the layers for different game modes in the server configuration."""
@@ -76,27 +88,41 @@ class LayerData:
 def get_layer_dataframes(layers: list[Layer]) -> LayerData:
     """Gets dataframes that represent the layers for different game modes in the server configuration.
 
+    The server's layers rarely change, so the result is cached against the layers' values. The returned dataframes are
+    shared between callers and must be treated as read-only.
+
     Args:
         layers (list[Layer]): A list of all layers that the server supports.
 
     Returns:
         LayerData: An object containing dataframes that represent the layers for different game modes.
     """
-    json_converter = cattrs_helpers.make_json_converter()
-    l2 = json_converter.unstructure(layers)
-
-    df_maps = pd.json_normalize(
-        l2,
-        None,
-        meta=["id", "environment", "game_mode", ["map", "id", "name", "pretty_name"]],
+    return _get_layer_dataframes(tuple(layers))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_layer_dataframes(layers: tuple[Layer, ...]) -> LayerData:
+    # Build the frame a column at a time from per-attribute lists, which avoids materialising a tuple per row. The
+    # categorical columns are created as categoricals directly rather than converted afterwards; the map ID is interned
+    # so that layers on the same map share one string object.
+    df_maps = pd.DataFrame(
+        {
+            "id": [layer.id for layer in layers],
+            "game_mode": pd.Categorical([layer.game_mode for layer in layers], dtype=_GAME_MODE_DTYPE),
+            "attackers": [layer.attackers for layer in layers],
+            "environment": pd.Categorical([layer.environment for layer in layers], dtype=_ENVIRONMENT_DTYPE),
+            "pretty_name": [layer.pretty_name for layer in layers],
+            "map.id": pd.Categorical([sys.intern(layer.map.id) for layer in layers]),
+            "map.name": [layer.map.name for layer in layers],
+            "map.pretty_name": [layer.map.pretty_name for layer in layers],
+        },
     )
 
-    # Convert certain columns to categories
-    cols = ["game_mode", "environment", "map.id"]
-    df_maps[cols] = df_maps[cols].astype("category")
-
-    df_warfare = df_maps.loc[df_maps["game_mode"] == "warfare"]
-    df_offensive = df_maps.loc[df_maps["game_mode"] == "offensive"]
-    df_skirmish = df_maps.loc[df_maps["game_mode"] == "control"]
+    # Split the layers by game mode in a single pass, rather than scanning the frame once per game mode
+    by_game_mode = dict(list(df_maps.groupby("game_mode", observed=True)))
+    no_layers = df_maps.iloc[:0]
+    df_warfare = by_game_mode.get("warfare", no_layers)
+    df_offensive = by_game_mode.get("offensive", no_layers)
+    df_skirmish = by_game_mode.get("control", no_layers)
 
     return LayerData(df_warfare=df_warfare, df_offensive=df_offensive, df_skirmish=df_skirmish)
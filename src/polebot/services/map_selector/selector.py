@@ -10,7 +10,7 @@ import pandas as pd
 from crcon.api_models import GameMode, Layer, ServerStatus, VoteMapUserConfig
 from polebot.models import WeightingParameters
 
-from .data_loader import get_layer_dataframes, get_weighting_dataframes
+from .data_loader import WeightingDataframes, get_layer_dataframes, get_weighting_dataframes
 
 _logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class MapSelector:
         self,
         server_status: ServerStatus,
         layers: Iterable[Layer],
-        weighting_params: WeightingParameters,
+        weighting_params: WeightingParameters | WeightingDataframes,
         votemap_config: VoteMapUserConfig,
         recent_layer_history: Sequence[str],
         logger: logging.Logger = _logger,
@@ -41,7 +41,8 @@ class MapSelector:
         Args:
             server_status (ServerStatus): The current server status.
             layers (Iterable[Layer]): A list of layers that the server supports.
-            weighting_params (WeightingParameters): The votemap weighting parameters for the server.
+            weighting_params (WeightingParameters | WeightingDataframes): The votemap weighting parameters for the
+            server, or dataframes previously built from them with `get_weighting_dataframes`.
             votemap_config (VoteMapUserConfig): The server's votemap configuration.
             recent_layer_history (Sequence[str]): An ordered list of the most recently played map layer IDs,
             most-recently-played last.
@@ -56,7 +57,11 @@ class MapSelector:
         self._layers_by_id = {layer.id: layer for layer in layers}
         self._current_layer = self._server_status.map
 
-        config_data = get_weighting_dataframes(weighting_params)
+        config_data = (
+            weighting_params
+            if isinstance(weighting_params, WeightingDataframes)
+            else get_weighting_dataframes(weighting_params)
+        )
         self._df_map_groups = config_data.df_map_groups
         self._df_environments = config_data.df_environments
         map_data = get_layer_dataframes(layers=list(layers))
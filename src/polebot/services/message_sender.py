@@ -1,37 +1,37 @@
-from asyncio import Task, TaskGroup
-from collections.abc import Iterable
+from asyncio import Semaphore, Task, TaskGroup
 
 from crcon.api_client import ApiClient
 from crcon.exceptions import ApiClientError
 
 from .player_matcher import PlayerMatcher, PlayerProperties
 
+_MAX_CONCURRENT_MESSAGES = 16
+
 
 class MessageSender:
-    def __init__(self, client: ApiClient) -> None:
+    def __init__(self, client: ApiClient, max_concurrency: int = _MAX_CONCURRENT_MESSAGES) -> None:
         self._client = client
+        # CRCON has no bulk message endpoint, so limit how many single-player requests are in flight at once
+        self._semaphore = Semaphore(max_concurrency)
 
-    async def send_group_message(self, player_matcher: PlayerMatcher, message: str) -> Iterable[PlayerProperties]:
-        player_ids = await self._client.get_playerids()
-        players = [PlayerProperties(name=name, id=player_id) for name, player_id in player_ids]
-        matched = [p for p in players if player_matcher.is_match(p)]
-        message_task_list: list[tuple[PlayerProperties, Task]] = []
+    async def send_group_message(self, player_matcher: PlayerMatcher, message: str) -> list[PlayerProperties]:
+        matched = await self.get_players_in_group(player_matcher)
 
         async def send_message(player_id: str, message: str) -> bool:
-            try:
-                await self._client.message_player(player_id, message)
-            except ApiClientError:
-                return False
-            return True
+            async with self._semaphore:
+                try:
+                    await self._client.message_player(player_id, message)
+                except ApiClientError:
+                    return False
+                return True
 
         async with TaskGroup() as tg:
-            for player in matched:
-                task = tg.create_task(send_message(player.id, message))
-                message_task_list.append((player, task))
+            message_task_list: list[tuple[PlayerProperties, Task[bool]]] = [
+                (player, tg.create_task(send_message(player.id, message))) for player in matched
+            ]
 
         return [p for p, task in message_task_list if not task.exception() and task.result()]
 
-    async def get_players_in_group(self, player_matcher: PlayerMatcher) -> Iterable[PlayerProperties]:
+    async def get_players_in_group(self, player_matcher: PlayerMatcher) -> list[PlayerProperties]:
         player_ids = await self._client.get_playerids()
-        players = [PlayerProperties(name=name, id=player_id) for name, player_id in player_ids]
-        return [p for p in players if player_matcher.is_match(p)]
+        return player_matcher.matches(PlayerProperties(name=name, id=player_id) for name, player_id in player_ids)
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Callable, Iterable
 
 from attrs import frozen
 
@@ -22,12 +23,27 @@ class PlayerMatcher:
         if self.exact and self._pattern is not None:
             raise ValueError("Exact match requires a simple string selector")
 
-    def is_match(self, player: PlayerProperties) -> bool:
+        # Choose the match strategy once, so that matching a whole player list doesn't re-check the mode per player
+        self.is_match: Callable[[PlayerProperties], bool]
         if self.exact:
-            return player.name == self.selector
-        if self._pattern is None:
-            return player.name.startswith(self.selector)
-        return re.match(self._pattern, player.name) is not None
+            self.is_match = self._match_exact
+        elif self._pattern is None:
+            self.is_match = self._match_prefix
+        else:
+            self._pattern_match = self._pattern.match
+            self.is_match = self._match_regex
+
+    def matches(self, players: Iterable[PlayerProperties]) -> list[PlayerProperties]:
+        return list(filter(self.is_match, players))
+
+    def _match_exact(self, player: PlayerProperties) -> bool:
+        return player.name == self.selector
+
+    def _match_prefix(self, player: PlayerProperties) -> bool:
+        return player.name.startswith(self.selector)
+
+    def _match_regex(self, player: PlayerProperties) -> bool:
+        return self._pattern_match(player.name) is not None
 
     @classmethod
     def validate_selector(cls, selector: str) -> tuple[bool, str | re.Pattern[str] | None]:
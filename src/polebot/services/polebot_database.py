@@ -1,78 +1,112 @@
 """Polebot database layer."""
 
+import asyncio
 import datetime as dt
-from collections.abc import Iterable, Sequence
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 from typing import Any, get_args
 
 import pymongo
 import pymongo.errors
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from cattrs import BaseValidationError
+from cattrs.preconf.bson import BsonConverter
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..app_config import AppConfig
 from ..exceptions import ConcurrencyError, DatastoreError, DuplicateKeyError
 from ..models import UNSAVED_SENTINEL, DbModel, GuildPlayerGroup, GuildServer
 from .cattrs_helpers import make_db_converter
 
+_logger = logging.getLogger(__name__)
+
+_THREADED_STRUCTURE_THRESHOLD = 50
+
+# Filters use bare values rather than `$eq`, which MongoDB treats the same for the scalar values used here
+_EMPTY_FILTER: dict[str, Any] = {}
+
+
+def _guild_filter(guild_id: int | None) -> dict[str, Any]:
+    return {"guild_id": guild_id} if guild_id else _EMPTY_FILTER
+
 
 class PolebotDatabase:
     """Data store for CRCON server details."""
 
-    def __init__(self, app_config: AppConfig, db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, app_config: AppConfig, db: AsyncDatabase) -> None:
         """Initialises the configuration repository."""
         self._app_config = app_config
         self._db = db
         self._converter = make_db_converter()
+        # Repositories are stateless apart from their collection and converter, so build each one once and share the
+        # converter between them
+        self._repos: dict[type[DbModel], _EntityRepository] = {
+            cls: repo_type(db, self._converter) for cls, repo_type in _EntityRepository.repository_map.items()
+        }
+        self._initialized = False
 
     async def initialize(self) -> None:
-        for repo in _EntityRepository.repository_map.values():
-            for index in repo.get_indexes():
-                await self._db[repo.collection_name].create_index(index.keys, **index.props)
+        if self._initialized:
+            return
+
+        # Send each collection's indexes in one command, and the collections concurrently
+        await asyncio.gather(
+            *(
+                repo.create_indexes(indexes)
+                for repo in self._repos.values()
+                if (indexes := [pymongo.IndexModel(index.keys, **index.props) for index in repo.get_indexes()])
+            ),
+        )
+        self._initialized = True
 
     async def insert[T: DbModel](self, obj: T) -> T:
-        cls = type(obj)
-        repo_type: type[_EntityRepository[T]] | None = _EntityRepository.repository_map.get(cls, None)
-        if not repo_type:
-            raise RuntimeError(f"Repository not found for type {cls.__name__}")
-        repo = repo_type(self._db)
+        repo = self._get_repo(type(obj))
         return await repo.insert(obj)
 
     async def update[T: DbModel](self, obj: T) -> T:
-        cls = type(obj)
-        repo_type: type[_EntityRepository[T]] | None = _EntityRepository.repository_map.get(cls, None)
-        if not repo_type:
-            raise RuntimeError(f"Repository not found for type {cls.__name__}")
-        repo = repo_type(self._db)
+        repo = self._get_repo(type(obj))
         return await repo.update(obj)
 
-    async def fetch_all[T: DbModel](self, cls: type[T], guild_id: int | None, *, sort: str | None = None) -> list[T]:
-        repo_type: type[_EntityRepository[T]] | None = _EntityRepository.repository_map.get(cls, None)
-        if not repo_type:
-            raise RuntimeError(f"Repository not found for type {cls.__name__}")
-        repo = repo_type(self._db)
-        try:
-            docs = await repo.fetch_all(guild_id, sort=sort)
-        except Exception as ex:
-            raise DatastoreError(f"Error reading {repo.model_desc} list") from ex
-        else:
-            return docs
+    async def fetch_all[T: DbModel](
+        self,
+        cls: type[T],
+        guild_id: int | None,
+        *,
+        sort: str | None = None,
+        limit: int | None = None,
+    ) -> list[T]:
+        repo = self._get_repo(cls)
+        return await repo.fetch_all(guild_id, sort=sort, limit=limit)
+
+    async def fetch_fields[T: DbModel](
+        self,
+        cls: type[T],
+        guild_id: int | None,
+        fields: Sequence[str],
+        *,
+        sort: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        repo = self._get_repo(cls)
+        return await repo.fetch_fields(guild_id, fields, sort=sort, limit=limit)
+
+    def iter_all[T: DbModel](self, cls: type[T], guild_id: int | None, *, sort: str | None = None) -> AsyncIterator[T]:
+        repo = self._get_repo(cls)
+        return repo.iter_all(guild_id, sort=sort)
 
     async def find_one[T: DbModel](self, cls: type[T], guild_id: int, attr_name: str, attr_value: Any) -> T | None:  # noqa: ANN401
-        repo_type: type[_EntityRepository[T]] | None = _EntityRepository.repository_map.get(cls, None)
-        if not repo_type:
-            raise RuntimeError(f"Repository not found for type {cls.__name__}")
-        repo = repo_type(self._db)
+        repo = self._get_repo(cls)
         return await repo.find_one(guild_id, attr_name=attr_name, attr_value=attr_value)
 
     async def delete[T: DbModel](self, cls: type[T], doc_id: ObjectId) -> None:
-        repo_type = _EntityRepository.repository_map.get(cls, None)
-        if not repo_type:
+        repo = self._get_repo(cls)
+        await repo.delete(doc_id)
+
+    def _get_repo[T: DbModel](self, cls: type[T]) -> "_EntityRepository[T]":
+        repo = self._repos.get(cls, None)
+        if not repo:
             raise RuntimeError(f"Repository not found for type {cls.__name__}")
-        repo = repo_type(self._db)
-        try:
-            await repo.delete(doc_id)
-        except Exception as ex:
-            raise DatastoreError(f"Error deleting {repo.model_desc}") from ex
+        return repo
 
 
 class IndexDefinition:
@@ -80,24 +114,52 @@ class IndexDefinition:
         self.keys = keys
         self.props = kwargs
 
+    @property
+    def key_names(self) -> list[str]:
+        return [key if isinstance(key, str) else key[0] for key in self.keys]
+
 
 class _EntityRepository[T: DbModel]:
     repository_map: dict[type[DbModel], type["_EntityRepository"]] = {}
     model_desc: str
     collection_name: str
     model_type: type[T]
+    indexed_attrs: frozenset[str]
 
     def __init_subclass__(cls, collection: str, model_desc: str) -> None:
         cls.model_desc = model_desc
         cls.collection_name = collection
         new_var = cls.__orig_bases__[0]  # type: ignore[attr-defined]
         cls.model_type = get_args(new_var)[0]
+        # The attributes that `find_one` can look up within a guild using an index: the ID, plus the second key of any
+        # index that starts with the guild ID
+        cls.indexed_attrs = frozenset(
+            ["_id"]
+            + [
+                key_names[1]
+                for key_names in (index.key_names for index in cls.get_indexes())
+                if len(key_names) > 1 and key_names[0] == "guild_id"
+            ],
+        )
         _EntityRepository.repository_map[cls.model_type] = cls
 
-    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, db: AsyncDatabase, converter: BsonConverter | None = None) -> None:
         self._db = db
         self._collection = db[self.collection_name]
-        self._converter = make_db_converter()
+        self._converter = converter or make_db_converter()
+        # Resolve the hooks for the model type once, rather than dispatching on the type for every document
+        self._unstructure = self._converter.get_unstructure_hook(self.model_type)
+        self._structure_hook: Callable[[Any, type[T]], T] = self._converter.get_structure_hook(self.model_type)
+
+    def _structure(self, doc: Any) -> T:  # noqa: ANN401
+        return self._structure_hook(doc, self.model_type)
+
+    async def create_indexes(self, indexes: list[pymongo.IndexModel]) -> None:
+        await self._collection.create_indexes(indexes)
+
+    def _structure_all(self, docs: Iterable[Any]) -> list[T]:
+        structure, model_type = self._structure_hook, self.model_type
+        return [structure(doc, model_type) for doc in docs]
 
     async def insert(self, obj: T) -> T:
         if obj._v != UNSAVED_SENTINEL:
@@ -105,11 +167,11 @@ class _EntityRepository[T: DbModel]:
         obj._v = 1
         obj._created_utc = obj._modified_utc = dt.datetime.now(dt.UTC)
         try:
-            doc = self._converter.unstructure(obj)
+            doc = self._unstructure(obj)
             result = await self._collection.insert_one(doc)
         except pymongo.errors.DuplicateKeyError as ex:
             raise DuplicateKeyError() from ex
-        except Exception as ex:
+        except pymongo.errors.PyMongoError as ex:
             raise DatastoreError(f"Error inserting {self.model_desc}") from ex
         else:
             obj._id = result.inserted_id
@@ -122,41 +184,81 @@ class _EntityRepository[T: DbModel]:
         obj._v += 1
         obj._modified_utc = dt.datetime.now(dt.UTC)
         try:
-            doc = self._converter.unstructure(obj)
-            result = await self._collection.replace_one({"_id": {"$eq": obj.id}, "_v": {"$eq": current_version}}, doc)
-        except Exception as ex:
+            doc = self._unstructure(obj)
+            result = await self._collection.replace_one({"_id": obj.id, "_v": current_version}, doc)
+        except pymongo.errors.PyMongoError as ex:
             raise DatastoreError(f"Error updating {self.model_desc}") from ex
         else:
             if result.modified_count == 0:
                 raise ConcurrencyError(current_version)
             return obj
 
-    async def fetch_all(self, guild_id: int | None, *, sort: str | None = None) -> list[T]:
+    async def fetch_all(self, guild_id: int | None, *, sort: str | None = None, limit: int | None = None) -> list[T]:
         try:
-            search_params = {"guild_id": {"$eq": guild_id}} if guild_id else {}
-            cursor = self._collection.find(search_params)
+            cursor = self._collection.find(_guild_filter(guild_id))
             if sort:
                 cursor.sort(sort)
-            result = [self._converter.structure(doc, self.model_type) for doc in await cursor.to_list(length=100)]
-        except Exception as ex:
+            if limit:
+                cursor.limit(limit)
+            docs = await cursor.to_list()
+            # Structuring is CPU-bound, so keep larger result sets off the event loop
+            if len(docs) > _THREADED_STRUCTURE_THRESHOLD:
+                result = await asyncio.to_thread(self._structure_all, docs)
+            else:
+                result = self._structure_all(docs)
+        except (pymongo.errors.PyMongoError, BaseValidationError) as ex:
             raise DatastoreError(f"Error reading {self.model_desc}") from ex
         else:
             return result
 
+    async def fetch_fields(
+        self,
+        guild_id: int | None,
+        fields: Sequence[str],
+        *,
+        sort: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        # Returns the raw projected documents, which skips transferring and structuring the fields that aren't needed
+        try:
+            projection = dict.fromkeys(fields, True) | {"_id": False}
+            cursor = self._collection.find(_guild_filter(guild_id), projection)
+            if sort:
+                cursor.sort(sort)
+            if limit:
+                cursor.limit(limit)
+            result = await cursor.to_list()
+        except pymongo.errors.PyMongoError as ex:
+            raise DatastoreError(f"Error reading {self.model_desc}") from ex
+        else:
+            return result
+
+    async def iter_all(self, guild_id: int | None, *, sort: str | None = None) -> AsyncIterator[T]:
+        try:
+            cursor = self._collection.find(_guild_filter(guild_id))
+            if sort:
+                cursor.sort(sort)
+            async for doc in cursor:
+                yield self._structure(doc)
+        except (pymongo.errors.PyMongoError, BaseValidationError) as ex:
+            raise DatastoreError(f"Error reading {self.model_desc}") from ex
+
     async def find_one(self, guild_id: int, attr_name: str, attr_value: Any) -> T | None:  # noqa: ANN401
+        if attr_name not in self.indexed_attrs:
+            _logger.warning("Looking up %s by %s, which is not indexed", self.model_desc, attr_name)
         try:
-            doc = await self._collection.find_one({"guild_id": {"$eq": guild_id}, attr_name: {"$eq": attr_value}})
-            result = self._converter.structure(doc, self.model_type) if doc else None
-        except Exception as ex:
+            doc = await self._collection.find_one({"guild_id": guild_id, attr_name: attr_value})
+            result = self._structure(doc) if doc else None
+        except (pymongo.errors.PyMongoError, BaseValidationError) as ex:
             raise DatastoreError(f"Error reading {self.model_desc}") from ex
         else:
             return result
 
     async def delete(self, doc_id: ObjectId) -> None:
         try:
-            await self._collection.delete_one({"_id": {"$eq": doc_id}})
-        except Exception as ex:
-            raise DatastoreError("Error deleting {self.model_desc}") from ex
+            await self._collection.delete_one({"_id": doc_id})
+        except pymongo.errors.PyMongoError as ex:
+            raise DatastoreError(f"Error deleting {self.model_desc}") from ex
 
     @classmethod
     def get_indexes(cls) -> Iterable[IndexDefinition]:
@@ -6,9 +6,9 @@ This class is responsible for managing the server lifecycle of a single CRCON se
 import asyncio
 import contextlib
 import logging
-from collections.abc import Iterable
+from collections.abc import Coroutine
 from types import TracebackType
-from typing import NoReturn, Self
+from typing import Any, NoReturn, Self
 
 from crcon import LogStreamClient
 from crcon.api_models import LogMessageType, LogStreamObject
@@ -128,19 +128,22 @@ class ServerController(contextlib.AbstractAsyncContextManager):
         if wait:
             await self._task_group_ended_event.wait()
 
-    async def send_group_message(self, player_matcher: PlayerMatcher, message: str) -> Iterable[PlayerProperties]:
+    async def send_group_message(self, player_matcher: PlayerMatcher, message: str) -> list[PlayerProperties]:
         """Send a message to the player group."""
         players = await self._message_sender.send_group_message(player_matcher, message)
-        logger.info("Sent message to %d players", len(list(players)))
+        logger.info("Sent message to %d players", len(players))
         return players
 
-    async def get_players_in_group(self, player_matcher: PlayerMatcher) -> Iterable[PlayerProperties]:
+    # The delegating methods below return the delegate's coroutine for the caller to await, rather than wrapping it in
+    # another coroutine of their own
+
+    def get_players_in_group(self, player_matcher: PlayerMatcher) -> Coroutine[Any, Any, list[PlayerProperties]]:
         """Get the players in the specified group."""
-        return await self._message_sender.get_players_in_group(player_matcher)
+        return self._message_sender.get_players_in_group(player_matcher)
 
-    async def get_player_vip_info(self, player_name: str) -> VipInfo | None:
+    def get_player_vip_info(self, player_name: str) -> Coroutine[Any, Any, VipInfo | None]:
         """Get the VIP information for the specified player."""
-        return await self._vip_manager.get_vip_by_name_or_id(player_name)
+        return self._vip_manager.get_vip_by_name_or_id(player_name)
 
     def _stop_internal(self) -> None:
         if self._task_group:
@@ -7,13 +7,16 @@ from jsonschema import Draft202012Validator, ValidationError
 from polebot.models import WeightingParameters
 from polebot.services import cattrs_helpers
 
+_PARAMS_CONVERTER = cattrs_helpers.make_params_converter()
+_SCHEMA = json.loads(Path(__file__).parent.resolve().joinpath("weighting_parameters.schema.json").read_text())
+_VALIDATOR = Draft202012Validator(_SCHEMA)
+
 
 class SettingsLoader:
     def __init__(self) -> None:
-        schema_path = Path(__file__).parent.resolve().joinpath("weighting_parameters.schema.json")
-        self._schema = json.loads(schema_path.read_text())
-        self._validator = Draft202012Validator(self._schema)
-        self._converter = cattrs_helpers.make_params_converter()
+        self._schema = _SCHEMA
+        self._validator = _VALIDATOR
+        self._converter = _PARAMS_CONVERTER
 
     def load_weighting_parameters(self, content: str) -> list[ValidationError] | WeightingParameters:
         json_content = json.loads(content)
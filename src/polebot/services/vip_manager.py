@@ -1,5 +1,6 @@
 import datetime as dt
 import logging
+import re
 from typing import Any
 
 import cachetools
@@ -10,6 +11,13 @@ from utils.cachetools import CacheItem, cache_item_ttu, ttl_cached
 
 logger = logging.getLogger(__name__)
 
+# Shitty format for VIP file puts the name in the middle. Names can contain spaces, so the ID runs up to the first
+# space and the expiry starts after the last one. The name may be empty, leaving one or two spaces between them
+# e.g. 76561198215199999 Some Random Player 3000-01-01T00:00:00+00:00
+_VIP_LINE_PATTERN = re.compile(r"(\S+) (?:(.*) )?(\S+)[ \t]*")
+# Expiry dates on or after this are used for VIP that never expires
+_PERMANENT_VIP_EXPIRY = dt.datetime(2999, 12, 30, tzinfo=dt.UTC)
+
 
 class VipManager:
     def __init__(self, api_client: ApiClient) -> None:
@@ -17,45 +25,53 @@ class VipManager:
         self._cache = cachetools.TLRUCache(maxsize=100, ttu=cache_item_ttu)
 
     async def get_vip_by_name_or_id(self, player_id_or_name: str) -> VipInfo | None:
-        vip_list = await self._get_vip_list()
-        return next((vip for vip in vip_list if _player_id_or_name_matches(player_id_or_name, vip)), None)
+        vip_index = await self._get_vip_index()
+        return vip_index.get(player_id_or_name)
 
     def get_cache(self, cache_hint: str | None = None) -> cachetools.TLRUCache[Any, CacheItem[Any]]:
         """Get the cache for this instance."""
         return self._cache
 
     @ttl_cached(time_to_live=60)
-    async def _get_vip_list(self) -> list[VipInfo]:
+    async def _get_vip_index(self) -> dict[str, VipInfo]:
         logger.debug("Downloading VIP list")
         vip_list_doc = await self._api_client.download_vips()
-        vip_list: list[VipInfo] = []
-        for line in vip_list_doc.splitlines():
-            try:
-                vip_list.append(_parse_vip(line))
-            except ValueError as ex:
-                logger.error("Error parsing VIP info from %s", line, exc_info=ex)
-        return vip_list
+        return _index_vips(_parse_vip_list(vip_list_doc))
+
+
+def _index_vips(vip_list: list[VipInfo]) -> dict[str, VipInfo]:
+    # Index each VIP by both player ID and name. Where an ID or name appears more than once, keep the first VIP in the
+    # list that has it, as a scan of the list would find
+    vip_index: dict[str, VipInfo] = {}
+    for vip in vip_list:
+        vip_index.setdefault(vip.player_id, vip)
+        vip_index.setdefault(vip.player_name, vip)
+    return vip_index
 
 
-def _player_id_or_name_matches(player_id_or_name: str, vip: VipInfo) -> bool:
-    return player_id_or_name in (vip.player_id, vip.player_name)
+def _parse_vip_list(vip_list_doc: str) -> list[VipInfo]:
+    vip_list: list[VipInfo] = []
+    for line in vip_list_doc.splitlines():
+        match = _VIP_LINE_PATTERN.fullmatch(line)
+        if not match:
+            if line.strip():
+                logger.error("Error parsing VIP info from %s: not in the expected format", line)
+            continue
+        try:
+            player_id, name, expiry = match.groups()
+            vip_list.append(_parse_vip(player_id, name or "", expiry))
+        except ValueError as ex:
+            logger.error("Error parsing VIP info from %s", line, exc_info=ex)
+    return vip_list
 
 
-def _parse_vip(line: str) -> VipInfo:
+def _parse_vip(player_id: str, name: str, expiry: str) -> VipInfo:
     try:
-        # Shitty format for VIP file puts the name in the middle. Names can contain spaces, so
-        # we have to look for spaces from the start and the end to extract the info
-        # e.g. 76561198215199999 Some Random Player 3000-01-01T00:00:00+00:00
-        pos1 = line.find(" ")
-        pos2 = line.rfind(" ")
-        player_id = line[:pos1]
-        name = line[pos1 + 1 : pos2]
-        tmp = line[pos2 + 1 :]
-        vip_expiry: dt.datetime | None = dt.datetime.fromisoformat(tmp)
-        if vip_expiry and vip_expiry >= dt.datetime(2999, 12, 30, tzinfo=dt.UTC):
+        vip_expiry: dt.datetime | None = dt.datetime.fromisoformat(expiry)
+        if vip_expiry and vip_expiry >= _PERMANENT_VIP_EXPIRY:
             vip_expiry = None
         vip = VipInfo(player_id, name, vip_expiry)
     except Exception as ex:
-        raise ValueError("Error parsing VIP info: %s", ex) from ex
+        raise ValueError(f"Error parsing VIP info: {ex}") from ex
     else:
         return vip
@@ -11,7 +11,7 @@ from typing import Any, Self
 import cachetools
 import cachetools.keys
 
-from crcon import ApiClient
+from crcon import ApiClient, LogStreamClient
 from crcon.api_models import (
     Layer,
     LogMessageType,
@@ -23,10 +23,15 @@ from crcon.exceptions import ApiClientError
 from utils.cachetools import CacheItem, cache_item_ttu, ttl_cached
 
 from ..models import WeightingParameters
-from .map_selector import MapSelector
+from .map_selector import MapSelector, WeightingDataframes, get_weighting_dataframes
 
 logger = logging.getLogger(__name__)
 
+# The most log messages to take from the queue at once
+_MAX_BATCH_SIZE = 64
+# The cache hints of the cached API calls below. None of the calls take arguments, so each cache holds one entry
+_CACHE_HINTS = ("status", "maps", "config")
+
 
 class VotemapProcessor(contextlib.AbstractAsyncContextManager):
     """The votemap manager is responsible for processing votemap selections on the server."""
@@ -46,9 +51,13 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         self._loop = loop
 
         self._weighting_parameters: WeightingParameters | None = None
+        self._weighting_dataframes: tuple[WeightingParameters, WeightingDataframes] | None = None
         self._votemap_config: VoteMapUserConfig | None = None
         self._exit_stack = contextlib.AsyncExitStack()
-        self._cache = cachetools.TLRUCache(maxsize=100, ttu=cache_item_ttu)
+        # One cache per TTL class, so that short-lived entries can never evict the long-lived, expensive ones
+        self._caches: dict[str | None, cachetools.TLRUCache[Any, CacheItem[Any]]] = {
+            hint: cachetools.TLRUCache(maxsize=1, ttu=cache_item_ttu) for hint in _CACHE_HINTS
+        }
         self._layer_history: deque[str] = deque(maxlen=10)
         self._enabled = False
 
@@ -74,7 +83,7 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         an async task, which can be cancelled to terminate processing.
         """
         if self._api_client is None:
-            raise RuntimeError("VotemapManager context must be entered")
+            raise RuntimeError("VotemapProcessor context must be entered")
 
         try:
             while True:
@@ -107,27 +116,43 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         self._weighting_parameters = value
 
     def get_cache(self, cache_hint: str | None = None) -> cachetools.TLRUCache[Any, CacheItem[Any]]:
-        """Get the cache for this instance."""
-        return self._cache
+        """Get the cache for this instance that holds entries with the given hint."""
+        return self._caches[cache_hint]
 
     async def _receive_and_process_message(self) -> None:
         """This is the main message processing loop.
 
-        It will block until a message is received from the queue, then process it. It swallows all Exceptions (therefore
-        not system exceptions), except QueueShutDown and CancelledError, which indicate to stop processing.
+        It will block until a message is received from the queue, then take any further messages that are already
+        waiting and process them together. Match start messages that are followed by another match start in the same
+        batch are skipped, as the votemap selection they would set up is replaced straight away. It swallows all
+        Exceptions (therefore not system exceptions), except QueueShutDown and CancelledError, which indicate to stop
+        processing.
 
         Note that the message types are filtered in the log stream client, so we only expect to receive messages that
         pass the filter. If you add new message types to the filter, you will need to update this method to handle them,
         and vice-versa. Likewise if you remove message types. Keep them in sync. The filter is configured in the server
         manager class.
         """
-        log = await self._queue.get()
+        batch = await self._receive_batch()
         try:
-            logger.debug("Message received of type %s", log.log.action)
             if not self.enabled:
-                await asyncio.sleep(1)
+                logger.debug("Votemap processing disabled, discarding %d messages", len(batch))
                 return
 
+            for log in _without_superseded_match_starts(batch):
+                await self._process_message(log)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _receive_batch(self) -> list[LogStreamObject]:
+        batch = [await self._queue.get()]
+        batch += LogStreamClient.drain(self._queue, max_items=_MAX_BATCH_SIZE - 1)
+        logger.debug("Messages received of types %s", [log.log.action for log in batch])
+        return batch
+
+    async def _process_message(self, log: LogStreamObject) -> None:
+        try:
             match log.log.action:
                 case LogMessageType.match_start:
                     await self._process_map_started()
@@ -139,14 +164,21 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
             raise
         except Exception as ex:  # noqa: BLE001
             logger.error("Error processing message", exc_info=ex)
-        finally:
-            self._queue.task_done()
 
     async def _process_map_started(self) -> None:
         logger.info("Processing map started")
-        selection = list(await self._generate_votemap_selection())
-        if len(selection):
-            await self._set_votemap_selection(selection)
+        # The fetches are independent, so make them concurrently. The saved whitelist both limits the selection and is
+        # restored once the selection is set, so it is only fetched once
+        status, layers, votemap_config, votemap_whitelist = await asyncio.gather(
+            self._get_server_status(),
+            self._get_server_maps(),
+            self._get_votemap_config(),
+            self._get_votemap_whitelist(),
+        )
+        votemap_whitelist = list(votemap_whitelist)
+        selection = self._generate_votemap_selection(status, layers, votemap_config, votemap_whitelist)
+        if selection:
+            await self._set_votemap_selection(selection, votemap_whitelist)
         else:
             logger.debug("No selection generated, skipping")
 
@@ -157,19 +189,22 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         current_map = status.map.id
         self._layer_history.appendleft(current_map)
 
-    async def _generate_votemap_selection(self) -> Iterable[str]:
+    def _generate_votemap_selection(
+        self,
+        status: ServerStatus,
+        layers: Iterable[Layer],
+        votemap_config: VoteMapUserConfig,
+        votemap_whitelist: Iterable[str],
+    ) -> list[str]:
         logger.debug("Generating a votemap selection")
         assert self._enabled and self._weighting_parameters  # noqa: S101
 
-        status = await self._get_server_status()
-        layers = await self._get_server_maps()
-        votemap_config = await self._get_votemap_config()
-        votemap_whitelist = await self._get_votemap_whitelist()
-        layers = [layer for layer in layers if layer.id in votemap_whitelist]
+        whitelisted_ids = frozenset(votemap_whitelist)
+        layers = [layer for layer in layers if layer.id in whitelisted_ids]
         selector = MapSelector(
             server_status=status,
             layers=layers,
-            weighting_params=self._weighting_parameters,
+            weighting_params=self._get_weighting_dataframes(self._weighting_parameters),
             votemap_config=votemap_config,
             recent_layer_history=self._layer_history,
         )
@@ -177,11 +212,19 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         logger.debug("Selection: [%s]", ",".join(selection))
         return selection
 
-    async def _set_votemap_selection(self, selection: Iterable[str]) -> None:
+    def _get_weighting_dataframes(self, weighting_parameters: WeightingParameters) -> WeightingDataframes:
+        # The weighting parameters only change when new settings are uploaded, so build their dataframes once for each
+        # parameters object rather than on every map change
+        cached = self._weighting_dataframes
+        if cached is None or cached[0] is not weighting_parameters:
+            cached = (weighting_parameters, get_weighting_dataframes(weighting_parameters))
+            self._weighting_dataframes = cached
+        return cached[1]
+
+    async def _set_votemap_selection(self, selection: list[str], saved_votemap_whitelist: list[str]) -> None:
         logger.info("Setting votemap selection to [%s]", ",".join(selection))
         assert self._api_client  # noqa: S101
 
-        saved_votemap_whitelist = await self._get_votemap_whitelist()
         logger.info("Saved votemap whitelist = [%s]", ",".join(saved_votemap_whitelist))
 
         try:
@@ -200,19 +243,19 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
             logger.debug("Restoring votemap whitelist")
             await self._api_client.set_votemap_whitelist(saved_votemap_whitelist)
 
-    @ttl_cached(time_to_live=10)
+    @ttl_cached(time_to_live=10, cache_hint="status")
     async def _get_server_status(self) -> ServerStatus:
         assert self._api_client  # noqa: S101
         logger.debug("Getting server status")
         return await self._api_client.get_status()
 
-    @ttl_cached(time_to_live=60 * 60 * 8)
+    @ttl_cached(time_to_live=60 * 60 * 8, cache_hint="maps")
     async def _get_server_maps(self) -> Iterable[Layer]:
         assert self._api_client  # noqa: S101
         logger.debug("Getting server maps")
         return await self._api_client.get_maps()
 
-    @ttl_cached(time_to_live=600)
+    @ttl_cached(time_to_live=600, cache_hint="config")
     async def _get_votemap_config(self) -> VoteMapUserConfig:
         assert self._api_client  # noqa: S101
         logger.debug("Getting votemap config")
@@ -222,3 +265,12 @@ class VotemapProcessor(contextlib.AbstractAsyncContextManager):
         assert self._api_client  # noqa: S101
         logger.debug("Getting votemap whitelist")
         return await self._api_client.get_votemap_whitelist()
+
+
+def _without_superseded_match_starts(logs: list[LogStreamObject]) -> list[LogStreamObject]:
+    # Match ends are always kept, as each one adds the finished map to the layer history
+    last_start = max(
+        (i for i, log in enumerate(logs) if log.log.action == LogMessageType.match_start),
+        default=-1,
+    )
+    return [log for i, log in enumerate(logs) if log.log.action != LogMessageType.match_start or i == last_start]
@@ -4,7 +4,7 @@ import asyncio
 import functools
 import os
 import random
-from collections.abc import Awaitable, Callable, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator
 from typing import Any, TypeGuard, TypeVar, overload
 from urllib.parse import urlparse
 
@@ -93,10 +93,43 @@ def is_async_callable(obj: Any) -> bool:
     return asyncio.iscoroutinefunction(obj) or (callable(obj) and asyncio.iscoroutinefunction(obj.__call__))  # type: ignore[reportFunctionMemberAccess,unused-ignore]
 
 
+def eager_task_factory[T](
+    loop: asyncio.AbstractEventLoop,
+    coro: Coroutine[Any, Any, T] | Generator[Any, None, T],
+    *,
+    eager_start: bool | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> asyncio.Task[T]:
+    """A task factory that starts running each new task's coroutine immediately.
+
+    Works like `asyncio.eager_task_factory`, but also accepts the `eager_start` argument that uvloop passes to task
+    factories. A coroutine that finishes without suspending completes within `create_task`, without being scheduled on
+    the event loop.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop that will run the task.
+        coro (Coroutine[Any, Any, T] | Generator[Any, None, T]): The coroutine to wrap in a task.
+        eager_start (bool | None, optional): Whether to start the task eagerly. Defaults to starting eagerly.
+        **kwargs: Other arguments for the `asyncio.Task` constructor.
+
+    Returns:
+        asyncio.Task[T]: The new task.
+    """
+    return asyncio.Task(coro, loop=loop, eager_start=eager_start is not False, **kwargs)  # type: ignore[arg-type]
+
+
 def is_absolute(url: str) -> bool:
     return bool(urlparse(url).netloc)
 
 type JSON = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
 
 
-__all__ = ["JSON", "backoff", "expand_environment", "is_async_callable", "is_absolute", "parse_content_type"]
+__all__ = [
+    "JSON",
+    "backoff",
+    "eager_task_factory",
+    "expand_environment",
+    "is_async_callable",
+    "is_absolute",
+    "parse_content_type",
+]
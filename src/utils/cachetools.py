@@ -1,17 +1,16 @@
 """A module containing utilities for caching."""
 
-import contextlib
-from collections.abc import Awaitable, Callable, Hashable
-from functools import wraps
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
 from typing import Any, ParamSpec, Protocol, TypeVar, runtime_checkable
 
 import cachetools
 import cachetools.keys
-import wrapt
 
 from . import is_async_callable
 
-# Wrapt is untyped, plus it's highly verbose to type decorators etc so we ignore for now
+# It's highly verbose to type decorators etc so we ignore for now
 # mypy: ignore-errors
 
 Param = ParamSpec("Param")
@@ -20,6 +19,11 @@ RetType = TypeVar("RetType")
 
 T = TypeVar("T")
 
+# Separates the positional arguments from the keyword arguments in a cache key
+_KWARGS_MARK = object()
+
+_hashkey = cachetools.keys.hashkey
+
 
 class CacheItem[T]:
     """A class representing an item in a cache."""
@@ -57,43 +61,62 @@ def ttl_cached(
 ) -> Callable[[Callable[Param, RetType]], Callable[Param, RetType]]:
     """A decorator that caches the result of a method for a specified time-to-live."""
 
-    def try_get_cache(
-        wrapped,  # noqa: ANN001
-        instance,  # noqa: ANN001
-        args: tuple[Hashable, ...],
-        kwargs: dict[str, Any],
-    ) -> tuple[cachetools.Cache[Any, CacheItem[Any]], tuple[Hashable, ...], CacheItem[Any] | None]:
-        if not isinstance(instance, CacheProvider):
-            raise RuntimeError("The wrapped method's parent class must implement the CacheProvider protocol")
-        cache = instance.get_cache(cache_hint)
-        func_name = wrapped.__name__
-        cache_key = cachetools.keys.hashkey(*args, __func_name__=func_name, **kwargs)
-        cache_result = cache.get(cache_key, None)
-        return (cache, cache_key, cache_result)
-
-    def wrapper(wrapped: Callable[Param, RetType]) -> Callable[Param, RetType]:
-        @wrapt.decorator
-        async def _async_run(wrapped, instance, args, kwargs):  # noqa: ARG001, ANN001, ANN202
-            cache, cache_key, cached_value = try_get_cache(wrapped, instance, args, kwargs)
-            if cached_value:
-                return cached_value.value
-            value = await wrapped(*args, **kwargs)
-            cache[cache_key] = CacheItem(time_to_live, value)
-            return value
-
-        @wrapt.decorator
-        def _sync_run(wrapped, instance, args, kwargs):  # noqa: ARG001, ANN001, ANN202
-            cache, cache_key, cached_value = try_get_cache(wrapped, instance, args, kwargs)
-            if cached_value:
-                return cached_value.value
-            value = wrapped(*args, **kwargs)
+    def get_cache(instance: Any) -> cachetools.Cache[Any, CacheItem[Any]]:  # noqa: ANN401
+        try:
+            get_instance_cache = instance.get_cache
+        except AttributeError:
+            raise RuntimeError("The wrapped method's parent class must implement the CacheProvider protocol") from None
+        return get_instance_cache(cache_hint)
+
+    def evict_if_failed(
+        cache: cachetools.Cache[Any, CacheItem[Any]],
+        cache_key: tuple[Any, ...],
+        task: asyncio.Future,
+    ) -> None:
+        # Don't keep failures in the cache, including a shared task that was itself cancelled
+        if task.cancelled() or task.exception() is not None:
+            cached_item = cache.get(cache_key, None)
+            if cached_item and cached_item.value is task:
+                del cache[cache_key]
+
+    def wrapper(wrapped: Callable[..., Any]) -> Callable[Param, RetType]:
+        key_prefix = (wrapped.__name__,)
+
+        def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, ...]:
+            if not kwargs:
+                return key_prefix + args
+            return (*key_prefix, *args, _KWARGS_MARK, *sorted(kwargs.items()))
+
+        @wraps(wrapped)
+        async def _async_run(instance, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            cache = get_cache(instance)
+            cache_key = make_key(args, kwargs)
+            try:
+                task = cache[cache_key].value
+            except KeyError:
+                # Cache the task rather than its result, so that concurrent callers share a single call
+                task = asyncio.ensure_future(wrapped(instance, *args, **kwargs))
+                cache[cache_key] = CacheItem(time_to_live, task)
+                task.add_done_callback(partial(evict_if_failed, cache, cache_key))
+            # Shield the shared task so that one caller being cancelled doesn't cancel it for the others
+            return await asyncio.shield(task)
+
+        @wraps(wrapped)
+        def _sync_run(instance, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003, ANN202
+            cache = get_cache(instance)
+            cache_key = make_key(args, kwargs)
+            try:
+                return cache[cache_key].value
+            except KeyError:
+                pass
+            value = wrapped(instance, *args, **kwargs)
             cache[cache_key] = CacheItem(time_to_live, value)
             return value
 
         if is_async_callable(wrapped):
-            return _async_run(wrapped)  # type: ignore[reportCallIssue]
+            return _async_run  # type: ignore[return-value]
 
-        return _sync_run(wrapped)  # type: ignore[reportCallIssue,call-arg]
+        return _sync_run  # type: ignore[return-value]
 
     return wrapper
 
@@ -117,18 +140,20 @@ def ttl_cache(
     seconds: int,
 ) -> Callable[[Callable[Param, Awaitable[RetType]]], Callable[Param, Awaitable[RetType]]]:
     def decorator(func: Callable[Param, Awaitable[RetType]]) -> Callable[Param, Awaitable[RetType]]:
-        func.cache = cachetools.TTLCache(size, ttl=seconds)  # type: ignore
+        cache = cachetools.TTLCache[Any, RetType](size, ttl=seconds)
 
         @wraps(func)
         async def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
-            k = cachetools.keys.hashkey(*args, **kwargs)
+            k = _hashkey(*args, **kwargs)
             try:
-                return func.cache[k]  # type: ignore
+                return cache[k]
             except KeyError:
                 pass  # key not found
             v = await func(*args, **kwargs)
-            with contextlib.suppress(ValueError):
-                func.cache[k] = v  # type: ignore
+            try:  # noqa: SIM105 - cheaper than contextlib.suppress on this path
+                cache[k] = v
+            except ValueError:
+                pass  # value too large for the cache
             return v
 
         return wrapper
@@ -1,11 +1,11 @@
 """This module contains the logging configuration for the application."""
 
 import atexit
-import contextlib
 import logging
 import logging.config
+import logging.handlers
 from pathlib import Path
-from queue import Queue
+from queue import Full, Queue
 from typing import Any, Literal, Optional
 
 
@@ -33,6 +33,46 @@ class OneLineExceptionFormatter(logging.Formatter):
         return s
 
 
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """A queue handler that drops records, rather than failing, when its queue is full.
+
+    The number of dropped records is reported in a warning record once the queue has room again.
+    """
+
+    def __init__(self, queue: Queue) -> None:  # type: ignore[type-arg]
+        """Initialises the handler.
+
+        Args:
+            queue (Queue): The bounded queue to put records on.
+        """
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:  # noqa: D102 (overriden method)
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self._make_dropped_record())
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+    def _make_dropped_record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="%d log records were dropped because the log queue was full",
+            args=(self.dropped,),
+            exc_info=None,
+        )
+
+
+# Bounds the memory used by queued log records if the listener thread falls behind
+_LOG_QUEUE_SIZE = 10000
+
+
 def configure_logger(log_dir: str, log_levels: str = ":INFO") -> None:
     """Configures the logger for the application.
 
@@ -53,7 +93,7 @@ def configure_logger(log_dir: str, log_levels: str = ":INFO") -> None:
     A special case is the logger named `!console` which will set the `console` log handler to the specified level.
     """
     logger_level_map = _parse_log_levels(log_levels)
-    buffer_queue = Queue()  # type: ignore
+    buffer_queue = Queue(maxsize=_LOG_QUEUE_SIZE)  # type: ignore
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
     logfile = log_path / "polebot.log"
@@ -87,7 +127,7 @@ def configure_logger(log_dir: str, log_levels: str = ":INFO") -> None:
                     "utc": True,
                 },
                 "queue_handler": {
-                    "class": "logging.handlers.QueueHandler",
+                    "class": DroppingQueueHandler,
                     "handlers": ["console", "file"],
                     "respect_handler_level": True,
                     "queue": buffer_queue,
@@ -123,23 +163,23 @@ def configure_logger(log_dir: str, log_levels: str = ":INFO") -> None:
 def _parse_log_levels(log_levels: str) -> dict[str, str]:
     level_map = logging.getLevelNamesMapping()
     levels: dict[str, str] = {}
-    for item in [
-        x.split(":") for x in [c.strip() for c in log_levels.split(",") if c.strip()]
-    ]:
-        with contextlib.suppress(ValueError):  # Ignore badly-formatted input values
-            logger_name, level_text, *_ = item
-            logger_name = logger_name.strip()
-            level_text = level_text.strip()
-
-            logger_name = "root" if logger_name == "" else logger_name
-            if level_text not in level_map:
-                if level_text.isdigit():
-                    # level_text is a numeric value - we can use it directly
-                    levels[logger_name] = level_text
-                # level_text is an invalid numeric value - just ignore
-                continue
-            else:
+    for item in log_levels.split(","):
+        logger_name, sep, level_text = item.partition(":")
+        if not sep:
+            continue  # Ignore badly-formatted input values
+        logger_name = logger_name.strip()
+        # Anything after a second colon is ignored
+        level_text = level_text.partition(":")[0].strip()
+
+        logger_name = "root" if logger_name == "" else logger_name
+        if level_text not in level_map:
+            if level_text.isdigit():
+                # level_text is a numeric value - we can use it directly
                 levels[logger_name] = level_text
+            # level_text is an invalid numeric value - just ignore
+            continue
+        else:
+            levels[logger_name] = level_text
 
     if "root" not in levels:
         levels["root"] = "INFO"
@@ -153,8 +193,10 @@ def _update_log_handlers() -> None:
     that any loggers that were instantiated during program initialisation will use our configured values instead of
     their default values.
     """
-    loggers = [logging.getLogger(name) for name in logging.root.manager.loggerDict]
-
-    for logger in loggers:
+    # Use the registered loggers directly instead of looking each one up again by name. Placeholders have no handlers
+    # and are replaced by a fresh logger when first used, so they are left alone.
+    for logger in list(logging.root.manager.loggerDict.values()):
+        if isinstance(logger, logging.PlaceHolder):
+            continue
         logger.propagate = True
         logger.handlers.clear()
@@ -1,3 +1,4 @@
+import functools
 from email.headerregistry import ContentTypeHeader
 from email.policy import EmailPolicy
 from typing import Any
@@ -10,7 +11,14 @@ def parse_content_type(content_type: str) -> tuple[str, dict[str, Any]]:
         content_type (str): The content type string.
 
     Returns:
-        _type_: The stuff.
+        tuple[str, dict[str, Any]]: The mime type and a new dictionary of its parameters.
     """
+    mime_type, params = _parse_content_type(content_type)
+    return (mime_type, dict(params))
+
+
+# Only a handful of distinct content types are ever seen, and the email header parser is slow
+@functools.lru_cache(maxsize=256)
+def _parse_content_type(content_type: str) -> tuple[str, tuple[tuple[str, Any], ...]]:
     header: ContentTypeHeader = EmailPolicy.header_factory("content-type", content_type)
-    return (header.content_type, dict(header.params))
+    return (header.content_type, tuple(header.params.items()))
@@ -17,16 +17,19 @@ class _TimezoneValidator:
         if not value.tzinfo:
             msg = f"'{attr.name}' must be timezone-aware"
             raise ValueError(msg)
-        if value.tzinfo.utcoffset(value) != self.tz.utcoffset(value):
-            offset1 = self.tz.utcoffset(value)
-            offset2 = value.tzinfo.utcoffset(value)
-            msg = f"Timezone UTC offset of '{attr.name}' must be {offset1}: {offset2}"
+        expected_offset = self.tz.utcoffset(value)
+        actual_offset = value.tzinfo.utcoffset(value)
+        if actual_offset != expected_offset:
+            msg = f"Timezone UTC offset of '{attr.name}' must be {expected_offset}: {actual_offset}"
             raise ValueError(msg)
 
     def __repr__(self) -> str:
         return f"timezone validator for {self.tz.tzname}>"
 
 
+_UTC_VALIDATOR = _TimezoneValidator(dt.UTC)
+
+
 def has_timezone(tz: dt.tzinfo) -> _TimezoneValidator:
     """A validator that raises `ValueError` if the initializer value's timezone does not match `tz`.
 
@@ -42,4 +45,4 @@ def is_utc() -> _TimezoneValidator:
     Args:
         tz (tzinfo): The required timezone.
     """
-    return _TimezoneValidator(dt.UTC)
+    return _UTC_VALIDATOR
@@ -1,12 +1,21 @@
 import asyncio
 
+import aiohttp
 import pytest
 import pytest_asyncio
 from aioresponses import aioresponses
+from multidict import CIMultiDict
+from yarl import URL
 
 from crcon import ApiClient, ServerConnectionDetails
 
 
+@pytest_asyncio.fixture()
+async def mock_response():
+    with aioresponses() as mocker:
+        yield mocker
+
+
 def describe_when_not_entered():
     """
     Tests of behaviour when the client context manager is not entered correctly.
@@ -34,11 +43,6 @@ def describe_when_entered():
     Tests of behaviour when the client context manager is entered correctly.
     """
 
-    @pytest_asyncio.fixture()
-    async def mock_response():
-        with aioresponses() as mocker:
-            yield mocker
-
     @pytest_asyncio.fixture()
     async def current_loop() -> asyncio.AbstractEventLoop:
         return asyncio.get_running_loop()
@@ -110,3 +114,68 @@ def describe_when_entered():
 
             # ***** ASSERT *****
             assert result.current_players == 96
+
+
+def describe_with_shared_session():
+    """
+    Tests of behaviour when the client is given a session shared with other clients.
+    """
+
+    @pytest_asyncio.fixture()
+    async def session():
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+    @pytest.mark.asyncio()
+    async def sends_server_headers(session: aiohttp.ClientSession, mock_response: aioresponses):
+        # ***** ARRANGE *****
+        server_details = ServerConnectionDetails(api_url="https://my.example.com", api_key="1234567890")
+        url = "https://my.example.com/api/send_message"
+        mock_response.post(
+            url,
+            status=200,
+            payload={
+                "result": None,
+                "command": "send_message",
+                "arguments": {},
+                "failed": False,
+                "error": None,
+                "forward_results": None,
+                "version": "v10.6.0",
+            },
+        )
+
+        # ***** ACT *****
+        async with ApiClient(server_details, asyncio.get_running_loop(), session=session) as sut:
+            await sut.message_player("1", "hello")
+
+        # ***** ASSERT *****
+        calls = mock_response.requests[("POST", URL(url))]
+        assert calls[0].kwargs["headers"]["Authorization"] == "BEARER 1234567890"
+
+    @pytest.mark.asyncio()
+    async def merges_caller_headers(session: aiohttp.ClientSession):
+        # ***** ARRANGE *****
+        server_details = ServerConnectionDetails(api_url="https://my.example.com", api_key="1234567890")
+
+        async with ApiClient(server_details, asyncio.get_running_loop(), session=session) as sut:
+            # ***** ACT *****
+            request_kwargs = sut._make_request("GET", "get_status", headers={"X-Request-Id": "abc"})._params.kwargs
+
+            # ***** ASSERT *****
+            assert request_kwargs is not None
+            headers = CIMultiDict(request_kwargs.get("headers") or {})
+            assert headers["Authorization"] == "BEARER 1234567890"
+            assert headers["X-Request-Id"] == "abc"
+
+    @pytest.mark.asyncio()
+    async def does_not_close_session(session: aiohttp.ClientSession):
+        # ***** ARRANGE *****
+        server_details = ServerConnectionDetails(api_url="https://my.example.com", api_key="1234567890")
+
+        # ***** ACT *****
+        async with ApiClient(server_details, asyncio.get_running_loop(), session=session):
+            pass
+
+        # ***** ASSERT *****
+        assert not session.closed
@@ -0,0 +1,115 @@
+import asyncio
+import datetime as dt
+import json
+
+import pytest
+
+from crcon import LogStreamClient, LogStreamClientSettings, LogStreamMessageError, ServerConnectionDetails
+from crcon.api_models import LogMessageType, LogStreamObject, StructuredLogLineWithMetaData
+from crcon.converters import make_rcon_converter
+
+
+@pytest.fixture
+def queue() -> asyncio.Queue[LogStreamObject]:
+    return asyncio.Queue[LogStreamObject]()
+
+
+@pytest.fixture
+def sut(queue: asyncio.Queue[LogStreamObject]) -> LogStreamClient:
+    settings = LogStreamClientSettings(max_websocket_connection_attempts=1)
+    server_details = ServerConnectionDetails(api_url="https://my.example.com", api_key="1234567890")
+    return LogStreamClient(settings, server_details, queue)
+
+
+def describe_drain():
+    def returns_empty_list_when_queue_is_empty():
+        queue = asyncio.Queue[LogStreamObject]()
+
+        result = LogStreamClient.drain(queue)
+
+        assert result == []
+
+    def returns_all_items_in_order():
+        queue = asyncio.Queue[LogStreamObject]()
+        logs = [create_log_stream_object(str(i)) for i in range(5)]
+        for log in logs:
+            queue.put_nowait(log)
+
+        result = LogStreamClient.drain(queue)
+
+        assert result == logs
+        assert queue.empty()
+
+    def stops_at_max_items():
+        queue = asyncio.Queue[LogStreamObject]()
+        logs = [create_log_stream_object(str(i)) for i in range(5)]
+        for log in logs:
+            queue.put_nowait(log)
+
+        result = LogStreamClient.drain(queue, max_items=3)
+
+        assert result == logs[:3]
+        assert queue.qsize() == 2
+
+    def stops_when_queue_is_shut_down():
+        queue = asyncio.Queue[LogStreamObject]()
+        logs = [create_log_stream_object(str(i)) for i in range(2)]
+        for log in logs:
+            queue.put_nowait(log)
+        queue.shutdown()
+
+        result = LogStreamClient.drain(queue)
+
+        assert result == logs
+
+
+def describe_handle_incoming_message():
+    @pytest.mark.asyncio
+    async def empty_message_updates_last_seen_id(sut: LogStreamClient, queue: asyncio.Queue[LogStreamObject]):
+        message = json.dumps({"logs": [], "last_seen_id": "1526919030474-0", "error": None})
+
+        await sut._handle_incoming_message(message)
+
+        assert sut.last_seen_id == "1526919030474-0"
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def logs_are_forwarded_to_queue(sut: LogStreamClient, queue: asyncio.Queue[LogStreamObject]):
+        logs = [create_log_stream_object(str(i)) for i in range(3)]
+        body = {"logs": make_rcon_converter().unstructure(logs), "last_seen_id": "2", "error": None}
+
+        await sut._handle_incoming_message(json.dumps(body))
+
+        assert sut.last_seen_id == "2"
+        assert LogStreamClient.drain(queue) == logs
+
+    @pytest.mark.asyncio
+    async def error_message_raises(sut: LogStreamClient):
+        message = json.dumps({"logs": [], "last_seen_id": None, "error": "Something went wrong"})
+
+        with pytest.raises(LogStreamMessageError) as exc_info:
+            await sut._handle_incoming_message(message)
+
+        assert exc_info.value.message == "Something went wrong"
+
+
+def create_log_stream_object(stream_id: str) -> LogStreamObject:
+    return LogStreamObject(
+        id=stream_id,
+        log=StructuredLogLineWithMetaData(
+            message="Map started",
+            version=1,
+            timestamp_ms=0,
+            event_time=dt.datetime.now(dt.UTC),
+            raw="",
+            relative_time_ms=0,
+            line_without_time="",
+            action=LogMessageType.match_start,
+            player_name_1=None,
+            player_id_1=None,
+            player_name_2=None,
+            player_id_2=None,
+            weapon=None,
+            sub_content=None,
+        ),
+    )
@@ -68,6 +68,46 @@ def describe_get_params_dataframes():
                 ("night", "Night", 50, 0.1),
             }
 
+    def describe_with_empty_groups():
+        @pytest.fixture
+        def weighting_params() -> WeightingParameters:
+            return WeightingParameters(
+                groups={
+                    "Top": MapGroup(weight=100, repeat_decay=0.8, maps=["carentan"]),
+                    "Unused": MapGroup(weight=80, repeat_decay=0.5, maps=[]),
+                },
+                environments={
+                    "Day": EnvironmentGroup(weight=100, repeat_decay=0.8, environments=["day"]),
+                    "Unused": EnvironmentGroup(weight=50, repeat_decay=0.1, environments=[]),
+                },
+            )
+
+        def empty_map_groups_produce_no_rows(weighting_params: WeightingParameters):
+            data = get_weighting_dataframes(weighting_params)
+
+            assert set(data.df_map_groups.itertuples(name=None)) == {("carentan", "Top", 100, 0.8)}
+
+        def empty_environment_groups_produce_no_rows(weighting_params: WeightingParameters):
+            data = get_weighting_dataframes(weighting_params)
+
+            assert set(data.df_environments.itertuples(name=None)) == {("day", "Day", 100, 0.8)}
+
+    def describe_with_no_maps():
+        @pytest.fixture
+        def weighting_params() -> WeightingParameters:
+            return WeightingParameters(
+                groups={"Unused": MapGroup(weight=80, repeat_decay=0.5, maps=[])},
+                environments={},
+            )
+
+        def keeps_column_types(weighting_params: WeightingParameters):
+            data = get_weighting_dataframes(weighting_params)
+
+            assert data.df_map_groups.empty
+            assert data.df_map_groups.index.name == "map"
+            assert data.df_map_groups["map_weight"].dtype == "int64"
+            assert data.df_environments["environment_repeat_decay"].dtype == "float64"
+
 def describe_get_map_dataframe():
     def describe_loads_dataframes():
         @pytest.fixture
@@ -93,3 +133,25 @@ def describe_get_map_dataframe():
             assert len(x.df_offensive) == 36
             assert len(x.df_skirmish) == 22
             assert (len(layers)) == 32 + 36 + 22
+
+        def flattens_layer_attributes(layers: list[Layer]):
+            x = get_layer_dataframes(layers)
+            row = x.df_offensive.loc[x.df_offensive["id"] == "PHL_L_1944_OffensiveGER"].iloc[0]
+            assert row["game_mode"] == "offensive"
+            assert row["attackers"] == "axis"
+            assert row["environment"] == "day"
+            assert row["map.id"] == "purpleheartlane"
+            assert row["map.pretty_name"] == "Purple Heart Lane"
+
+        def caches_result_for_equal_layers(layers: list[Layer]):
+            x = get_layer_dataframes(layers)
+            y = get_layer_dataframes(list(layers))
+            assert x is y
+
+        def missing_game_modes_are_empty(layers: list[Layer]):
+            warfare_only = [layer for layer in layers if layer.game_mode == "warfare"]
+            x = get_layer_dataframes(warfare_only)
+            assert len(x.df_warfare) == 32
+            assert len(x.df_offensive) == 0
+            assert len(x.df_skirmish) == 0
+            assert list(x.df_offensive.columns) == list(x.df_warfare.columns)
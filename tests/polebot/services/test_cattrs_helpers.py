@@ -231,6 +231,16 @@ def describe_params_converter():
             assert boost1.repeat_decay == 0.6
             assert len(config.environments) == 3
 
+        def round_trips_config(converter: JsonConverter, contents: Any):
+            # ***** ARRANGE *****
+            config = converter.structure(contents, WeightingParameters)
+
+            # ***** ACT *****
+            result = converter.structure(converter.unstructure(config), WeightingParameters)
+
+            # ***** ASSERT *****
+            assert result == config
+
 def describe_db_converter():
     @pytest.fixture
     def converter() -> BsonConverter:
@@ -2,11 +2,16 @@
 import pytest
 from mongomock_motor import AsyncMongoMockClient
 
+from crcon.server_connection_details import ServerConnectionDetails
 from polebot.app_config import AppConfig
+from polebot.exceptions import DatastoreError
 from polebot.models import (
     GuildPlayerGroup,
+    GuildServer,
+    MapGroup,
+    WeightingParameters,
 )
-from polebot.services.polebot_database import PolebotDatabase, _GuildPlayerGroupRepository
+from polebot.services.polebot_database import PolebotDatabase, _GuildPlayerGroupRepository, _GuildServerRepository
 
 
 def describe_test_something():
@@ -28,3 +33,133 @@ def describe_test_something():
 
         found = await pdb.find_one(GuildPlayerGroup, 1234, "_id", inserted.id)
         assert found
+
+    @pytest.mark.asyncio
+    async def iter_all_yields_all_guild_documents():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        for label in ["ONE", "TWO", "THREE"]:
+            await pdb.insert(GuildPlayerGroup(guild_id=1234, label=label, selector="some_stuff"))
+        await pdb.insert(GuildPlayerGroup(guild_id=5678, label="OTHER", selector="some_stuff"))
+
+        labels = [group.label async for group in pdb.iter_all(GuildPlayerGroup, 1234, sort="label")]
+        assert labels == ["ONE", "THREE", "TWO"]
+
+    @pytest.mark.asyncio
+    async def repositories_share_database_converter():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        repo = pdb._get_repo(GuildPlayerGroup)
+
+        assert repo is pdb._get_repo(GuildPlayerGroup)
+        assert repo._converter is pdb._converter
+
+    @pytest.mark.asyncio
+    async def insert_and_find_guild_server():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        obj = GuildServer(
+            guild_id=1234,
+            label="ONE",
+            name="Server One",
+            crcon_details=ServerConnectionDetails("https://server.example.com", "some key"),
+            weighting_parameters=WeightingParameters(
+                groups={"Top": MapGroup(weight=100, repeat_decay=0.8, maps=["carentan"])},
+                environments={},
+            ),
+        )
+        await pdb.insert(obj)
+
+        found = await pdb.find_one(GuildServer, 1234, "label", "ONE")
+        assert found
+        assert found.id == obj.id
+        assert found.crcon_details == obj.crcon_details
+        assert found.weighting_parameters == obj.weighting_parameters
+
+    @pytest.mark.asyncio
+    async def fetch_fields_returns_only_requested_fields():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        for label in ["ONE", "TWO"]:
+            await pdb.insert(GuildPlayerGroup(guild_id=1234, label=label, selector=f"{label}_selector"))
+        await pdb.insert(GuildPlayerGroup(guild_id=5678, label="OTHER", selector="some_stuff"))
+
+        docs = await pdb.fetch_fields(GuildPlayerGroup, 1234, ["label"], sort="label")
+        assert docs == [{"label": "ONE"}, {"label": "TWO"}]
+
+    @pytest.mark.asyncio
+    async def initialize_creates_indexes_once():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        await pdb.initialize()
+        await pdb.initialize()
+
+        server_indexes = await mock_db["servers"].index_information()
+        group_indexes = await mock_db["player_groups"].index_information()
+        assert {"guild_servers_by_label", "guild_servers_by_url"} <= server_indexes.keys()
+        assert "player_groups_by_label" in group_indexes
+
+    @pytest.mark.asyncio
+    async def fetch_all_structures_large_result_sets():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        labels = [f"G{i:02}" for i in range(60)]
+        for label in labels:
+            await pdb.insert(GuildPlayerGroup(guild_id=1234, label=label, selector="some_stuff"))
+
+        groups = await pdb.fetch_all(GuildPlayerGroup, 1234, sort="label")
+        assert [group.label for group in groups] == labels
+
+    @pytest.mark.asyncio
+    async def fetch_all_returns_every_document_unless_limited():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        labels = [f"G{i:03}" for i in range(120)]
+        for label in labels:
+            await pdb.insert(GuildPlayerGroup(guild_id=1234, label=label, selector="some_stuff"))
+
+        groups = await pdb.fetch_all(GuildPlayerGroup, 1234, sort="label")
+        limited = await pdb.fetch_all(GuildPlayerGroup, 1234, sort="label", limit=10)
+
+        assert [group.label for group in groups] == labels
+        assert [group.label for group in limited] == labels[:10]
+
+    def repositories_know_their_indexed_attributes():
+        assert _GuildServerRepository.indexed_attrs == {"_id", "label", "crcon_details.api_url"}
+        assert _GuildPlayerGroupRepository.indexed_attrs == {"_id", "label"}
+
+    @pytest.mark.asyncio
+    async def find_one_warns_on_unindexed_attribute(caplog: pytest.LogCaptureFixture):
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+
+        await pdb.find_one(GuildPlayerGroup, 1234, "selector", "some_stuff")
+        await pdb.find_one(GuildPlayerGroup, 1234, "label", "ONE")
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert warnings == ["Looking up player group by selector, which is not indexed"]
+
+    @pytest.mark.asyncio
+    async def find_one_reports_unreadable_documents_as_datastore_errors():
+        client = AsyncMongoMockClient(tz_aware=True)
+        mock_db = client.get_database("tests")
+        pdb = PolebotDatabase(AppConfig(), mock_db)  # type: ignore
+        await mock_db[_GuildPlayerGroupRepository.collection_name].insert_one({"guild_id": 1234, "label": "ONE"})
+
+        with pytest.raises(DatastoreError):
+            await pdb.find_one(GuildPlayerGroup, 1234, "label", "ONE")
@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from crcon import ApiClient
+from crcon.exceptions import ApiClientError
+from polebot.services.message_sender import MessageSender
+from polebot.services.player_matcher import PlayerMatcher
+
+
+@pytest.fixture
+def api_client() -> AsyncMock:
+    client = AsyncMock(spec=ApiClient)
+    client.get_playerids.return_value = [(f"player{i}", str(i)) for i in range(10)] + [("other", "99")]
+    return client
+
+
+def describe_send_group_message():
+    @pytest.mark.asyncio
+    async def sends_to_matched_players_only(api_client: AsyncMock):
+        # *** ARRANGE ***
+        sut = MessageSender(api_client)
+
+        # *** ACT ***
+        sent = await sut.send_group_message(PlayerMatcher("player"), "hello")
+
+        # *** ASSERT ***
+        assert sorted(p.id for p in sent) == sorted(str(i) for i in range(10))
+        assert api_client.message_player.call_count == 10
+
+    @pytest.mark.asyncio
+    async def excludes_players_whose_message_failed(api_client: AsyncMock):
+        # *** ARRANGE ***
+        async def message_player(player_id: str, message: str) -> None:
+            if player_id == "3":
+                raise ApiClientError("Request failed", "send_message", "Player left", None)
+
+        api_client.message_player.side_effect = message_player
+        sut = MessageSender(api_client)
+
+        # *** ACT ***
+        sent = await sut.send_group_message(PlayerMatcher("player"), "hello")
+
+        # *** ASSERT ***
+        assert "3" not in {p.id for p in sent}
+        assert len(list(sent)) == 9
+
+    @pytest.mark.asyncio
+    async def limits_concurrent_requests(api_client: AsyncMock):
+        # *** ARRANGE ***
+        in_flight = 0
+        max_in_flight = 0
+
+        async def message_player(player_id: str, message: str) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        api_client.message_player.side_effect = message_player
+        sut = MessageSender(api_client, max_concurrency=3)
+
+        # *** ACT ***
+        await sut.send_group_message(PlayerMatcher("player"), "hello")
+
+        # *** ASSERT ***
+        assert max_in_flight == 3
@@ -63,6 +63,26 @@ def describe_regex_match():
         assert not matcher.is_match(player)
 
 
+def describe_matches():
+    def returns_matching_players_in_order():
+        matcher = PlayerMatcher(selector="/^[AB]-/")
+        players = [
+            PlayerProperties(name="A-one", id="1"),
+            PlayerProperties(name="C-two", id="2"),
+            PlayerProperties(name="B-three", id="3"),
+            PlayerProperties(name="xA-four", id="4"),
+        ]
+
+        result = matcher.matches(players)
+
+        assert [p.id for p in result] == ["1", "3"]
+
+    def returns_empty_list_for_no_players():
+        matcher = PlayerMatcher(selector="test")
+
+        assert matcher.matches([]) == []
+
+
 def describe_initialization_errors():
     def invalid_selector_raises_value_error():
         with pytest.raises(ValueError, match="Selector is not a valid regular expression"):
@@ -55,6 +55,73 @@ def when_vip_list_is_not_empty():
         assert result is not None
         assert result.vip_expiry is None
 
+    @pytest.mark.asyncio
+    async def name_matching_another_players_id_finds_first_in_list():
+        vip_list = "\n".join(
+            [
+                "76561198215199999 76561198215199998 2025-11-09T12:04:55+00:00",
+                "76561198215199998 Joe Random 2 2025-04-07T17:03:29+00:00",
+            ],
+        )
+        sut = VipManager(mock_api_client(vip_list))
+
+        result = await sut.get_vip_by_name_or_id("76561198215199998")
+        assert result is not None
+        assert result.player_id == "76561198215199999"
+
+
+def when_vip_list_has_bad_lines():
+
+    @pytest.mark.asyncio
+    async def skips_bad_lines():
+        vip_list = "\r\n".join(
+            [
+                "76561198215199999 Joe Random 1 2025-11-09T12:04:55+00:00",
+                "not-a-vip-line",
+                "76561198215199998 Joe Random 2 not-a-date",
+                "",
+                "76561198215199997 Joe Random 3 2025-01-01T00:00:00+00:00",
+            ],
+        )
+        sut = VipManager(mock_api_client(vip_list))
+
+        result = await sut.get_vip_by_name_or_id("Joe Random 3")
+        assert result is not None
+        assert result.vip_expiry == dt.datetime(2025, 1, 1, tzinfo=dt.UTC)
+        assert await sut.get_vip_by_name_or_id("Joe Random 1") is not None
+        assert await sut.get_vip_by_name_or_id("Joe Random 2") is None
+
+    @pytest.mark.asyncio
+    async def accepts_lines_without_name():
+        vip_list = "\n".join(
+            [
+                "76561198215199999 2025-11-09T12:04:55+00:00",
+                "76561198215199998  2025-04-07T17:03:29+00:00",
+            ],
+        )
+        sut = VipManager(mock_api_client(vip_list))
+
+        for player_id in ("76561198215199999", "76561198215199998"):
+            result = await sut.get_vip_by_name_or_id(player_id)
+            assert result is not None
+            assert result.player_name == ""
+
+    @pytest.mark.asyncio
+    async def logs_malformed_line(caplog: pytest.LogCaptureFixture):
+        vip_list = "\n".join(
+            [
+                "76561198215199999 Joe Random 1 2025-11-09T12:04:55+00:00",
+                " 76561198215199998 Joe Random 2 2025-04-07T17:03:29+00:00",
+            ],
+        )
+        sut = VipManager(mock_api_client(vip_list))
+
+        result = await sut.get_vip_by_name_or_id("76561198215199998")
+        assert result is None
+        errors = [record for record in caplog.records if record.levelname == "ERROR"]
+        assert len(errors) == 1
+        assert "76561198215199998 Joe Random 2" in errors[0].getMessage()
+
 
 def mock_api_client(download_vip_list: str) -> AsyncMock:
     client = AsyncMock(spec=ApiClient)
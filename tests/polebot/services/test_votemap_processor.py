@@ -126,6 +126,68 @@ def describe_process_map_started():
         assert len(whitelists[1]) == 90
         assert api_client.set_votemap_whitelist.call_count == 2
         assert api_client.reset_votemap_state.call_count == 1
+        assert api_client.get_votemap_whitelist.call_count == 1
+
+
+def describe_cached_api_calls():
+    @pytest.mark.asyncio
+    async def each_call_is_cached_separately(
+        standard_api_client: ApiClient,
+        queue: asyncio.Queue,
+    ):
+        # *** ARRANGE ***
+        sut = VotemapProcessor(queue, standard_api_client, asyncio.get_event_loop())
+
+        # *** ACT ***
+        for _ in range(3):
+            await sut._get_server_status()
+            await sut._get_server_maps()
+            await sut._get_votemap_config()
+
+        # *** ASSERT ***
+        assert standard_api_client.get_status.call_count == 1  # type: ignore[attr-defined]
+        assert standard_api_client.get_maps.call_count == 1  # type: ignore[attr-defined]
+        assert standard_api_client.get_votemap_config.call_count == 1  # type: ignore[attr-defined]
+        assert all(len(sut.get_cache(hint)) == 1 for hint in ("status", "maps", "config"))
+
+
+def describe_get_weighting_dataframes():
+    @pytest.mark.asyncio
+    async def reuses_dataframes_for_same_parameters(
+        standard_weighting_params: WeightingParameters,
+        standard_api_client: ApiClient,
+        queue: asyncio.Queue,
+    ):
+        # *** ARRANGE ***
+        sut = VotemapProcessor(queue, standard_api_client, asyncio.get_event_loop())
+        first = sut._get_weighting_dataframes(standard_weighting_params)
+
+        # *** ACT ***
+        second = sut._get_weighting_dataframes(standard_weighting_params)
+
+        # *** ASSERT ***
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def rebuilds_dataframes_for_new_parameters(
+        standard_weighting_params: WeightingParameters,
+        standard_api_client: ApiClient,
+        queue: asyncio.Queue,
+    ):
+        # *** ARRANGE ***
+        sut = VotemapProcessor(queue, standard_api_client, asyncio.get_event_loop())
+        first = sut._get_weighting_dataframes(standard_weighting_params)
+        new_params = WeightingParameters(
+            groups={"Only": MapGroup(weight=50, repeat_decay=0.5, maps=["carentan"])},
+            environments=standard_weighting_params.environments,
+        )
+
+        # *** ACT ***
+        second = sut._get_weighting_dataframes(new_params)
+
+        # *** ASSERT ***
+        assert second is not first
+        assert list(second.df_map_groups.index) == ["carentan"]
 
 
 def when_instance_is_created():
@@ -355,6 +417,61 @@ def when_receiving_map_ended_message():
         assert sut._layer_history[1] == "utahbeach_warfare"
 
 
+def when_receiving_several_messages_at_once():
+    @pytest.mark.asyncio
+    async def only_latest_match_start_is_processed(
+        standard_weighting_params: WeightingParameters,
+        standard_api_client: AsyncMock,
+    ):
+        # *** ARRANGE ***
+        queue = asyncio.Queue[LogStreamObject]()
+        sut = VotemapProcessor(queue, standard_api_client, asyncio.get_event_loop())
+        sut.weighting_params = standard_weighting_params
+        sut.enabled = True
+        processed: list[str] = []
+
+        async def process_map_started() -> None:
+            processed.append("start")
+
+        async def process_map_ended() -> None:
+            processed.append("end")
+
+        sut._process_map_started = process_map_started  # type: ignore[method-assign]
+        sut._process_map_ended = process_map_ended  # type: ignore[method-assign]
+        for action in [
+            LogMessageType.match_start,
+            LogMessageType.match_end,
+            LogMessageType.match_start,
+            LogMessageType.match_end,
+            LogMessageType.match_start,
+        ]:
+            queue.put_nowait(create_log_stream_object(action))
+        queue.shutdown()
+
+        # *** ACT ***
+        await sut.run()
+
+        # *** ASSERT ***
+        assert processed == ["end", "end", "start"]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def messages_are_discarded_without_delay_if_not_enabled(standard_api_client: AsyncMock):
+        # *** ARRANGE ***
+        queue = asyncio.Queue[LogStreamObject]()
+        sut = VotemapProcessor(queue, standard_api_client, asyncio.get_event_loop())
+        for _ in range(100):
+            queue.put_nowait(create_log_stream_object(LogMessageType.match_start))
+        queue.shutdown()
+
+        # *** ACT ***
+        await asyncio.wait_for(sut.run(), timeout=1)
+
+        # *** ASSERT ***
+        assert queue.empty()
+        assert standard_api_client.set_votemap_whitelist.call_count == 0
+
+
 def mock_api_client(
     status: ServerStatus,
     layers: list[Layer],
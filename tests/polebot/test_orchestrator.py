@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from lagom import Container
+
+from crcon.server_connection_details import ServerConnectionDetails
+from polebot.container_provider import ContainerProvider
+from polebot.exceptions import DatastoreError
+from polebot.models import GuildServer, WeightingParameters
+from polebot.orchestrator import OrchestrationError, Orchestrator
+from polebot.services.polebot_database import PolebotDatabase
+
+
+@pytest.fixture
+def guild_server() -> GuildServer:
+    return GuildServer(
+        guild_id=1234,
+        label="srv",
+        name="My Server",
+        crcon_details=ServerConnectionDetails(api_url="https://my.example.com", api_key="1234567890"),
+        weighting_parameters=WeightingParameters(groups={}, environments={}),
+    )
+
+
+@pytest.fixture
+def db(guild_server: GuildServer) -> AsyncMock:
+    db = AsyncMock(spec=PolebotDatabase)
+    db.find_one.return_value = guild_server
+    return db
+
+
+@pytest.fixture
+def sut(db: AsyncMock, guild_server: GuildServer) -> Orchestrator:
+    container = Container()
+    container[PolebotDatabase] = lambda: db
+    orchestrator = Orchestrator(ContainerProvider(container), db, asyncio.Event(), MagicMock(discord_owner_id=1))
+    orchestrator._server_controllers[guild_server.id] = MagicMock()
+    return orchestrator
+
+
+def describe_set_server_votemap_enabled():
+    @pytest.mark.asyncio
+    async def caches_the_saved_server(sut: Orchestrator, db: AsyncMock, guild_server: GuildServer):
+        # *** ARRANGE ***
+        async def update(obj: GuildServer) -> GuildServer:
+            return obj
+
+        db.update.side_effect = update
+
+        # *** ACT ***
+        saved, changed = await sut.set_server_votemap_enabled(1234, "srv", True)
+
+        # *** ASSERT ***
+        assert changed is True
+        assert saved.enable_votemap is True
+        assert guild_server.enable_votemap is False
+        assert await sut.get_guild_server(1234, "srv") is saved
+        assert db.find_one.call_count == 1
+
+    @pytest.mark.asyncio
+    async def does_not_change_cached_server_when_save_fails(
+        sut: Orchestrator,
+        db: AsyncMock,
+        guild_server: GuildServer,
+    ):
+        # *** ARRANGE ***
+        db.update.side_effect = DatastoreError("Error updating server")
+        version = guild_server.db_version
+
+        # *** ACT ***
+        with pytest.raises(OrchestrationError):
+            await sut.set_server_votemap_enabled(1234, "srv", True)
+        reloaded = await sut.get_guild_server(1234, "srv")
+
+        # *** ASSERT ***
+        assert guild_server.enable_votemap is False
+        assert guild_server.db_version == version
+        assert reloaded is guild_server
+        assert db.find_one.call_count == 2
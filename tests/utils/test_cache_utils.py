@@ -11,11 +11,14 @@ from utils.cachetools import CacheItem, cache_item_ttu, ttl_cached
 class HasCache:
     def __init__(self):
         self._cache = cachetools.TLRUCache[Any, CacheItem[Any]](maxsize=100, ttu=cache_item_ttu)
+        self.calls = 0
+        self.fail_first_call = False
+        self.cancel_first_call = False
 
     def get_cache(self, cache_hint: str | None = None) -> cachetools.TLRUCache[Any, CacheItem[Any]]:
         return self._cache
 
-    @ttl_cached(time_to_live=0.05)
+    @ttl_cached(time_to_live=0.005)
     def short_ttl(self) -> str:
         return f"Time: {time.monotonic()}"
 
@@ -23,24 +26,92 @@ class HasCache:
     def long_ttl(self) -> str:
         return f"Time: {time.monotonic()}"
 
-    @ttl_cached(time_to_live=0.05)
+    @ttl_cached(time_to_live=100)
+    def counted_none(self) -> None:
+        self.calls += 1
+
+    @ttl_cached(time_to_live=100)
+    def counted_with_args(self, value: int, offset: int = 0) -> int:
+        self.calls += 1
+        return value + offset
+
+    @ttl_cached(time_to_live=0.005)
     async def short_ttl_async(self) -> str:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return f"Time: {time.monotonic()}"
 
     @ttl_cached(time_to_live=100)
     async def long_ttl_async(self) -> str:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return f"Time: {time.monotonic()}"
 
+    @ttl_cached(time_to_live=100)
+    async def counted_async(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.calls == 1 and self.fail_first_call:
+            raise ValueError("first call fails")
+        if self.calls == 1 and self.cancel_first_call:
+            raise asyncio.CancelledError
+        return self.calls
+
+
+class HasNoCache:
+    @ttl_cached(time_to_live=100)
+    def cached(self) -> str:
+        return "value"
+
+
 def describe_sync_methods():
+    def fails_without_cache_provider():
+        # *** ARRANGE ***
+        sut = HasNoCache()
+
+        # *** ACT ***
+        with pytest.raises(RuntimeError, match="CacheProvider"):
+            sut.cached()
+
+    def caches_falsy_results():
+        # *** ARRANGE ***
+        sut = HasCache()
+
+        # *** ACT ***
+        result1 = sut.counted_none()
+        result2 = sut.counted_none()
+
+        # *** ASSERT ***
+        assert result1 is None
+        assert result2 is None
+        assert sut.calls == 1
+
+    def caches_each_set_of_arguments_separately():
+        # *** ARRANGE ***
+        sut = HasCache()
+
+        # *** ACT ***
+        results = [
+            sut.counted_with_args(1),
+            sut.counted_with_args(2),
+            sut.counted_with_args(1, offset=1),
+            sut.counted_with_args(1, offset=1),
+            sut.counted_with_args(1),
+        ]
+
+        # *** ASSERT ***
+        assert results == [1, 2, 2, 2, 1]
+        assert sut.calls == 3
+
+    def keeps_wrapped_method_name():
+        # *** ASSERT ***
+        assert HasCache.long_ttl.__name__ == "long_ttl"
+
     def results_change_with_short_ttl():
         # *** ARRANGE ***
         sut = HasCache()
 
         # *** ACT ***
         result1 = sut.short_ttl()
-        time.sleep(0.25)
+        time.sleep(0.02)
         result2 = sut.short_ttl()
 
         # *** ASSERT ***
@@ -54,7 +125,7 @@ def describe_sync_methods():
 
         # *** ACT ***
         result1 = sut.long_ttl()
-        time.sleep(0.25)
+        time.sleep(0.02)
         result2 = sut.long_ttl()
 
         # *** ASSERT ***
@@ -71,7 +142,7 @@ def describe_async_methods():
 
         # *** ACT ***
         result1 = await sut.short_ttl_async()
-        await asyncio.sleep(0.25)
+        await asyncio.sleep(0.02)
         result2 = await sut.short_ttl_async()
 
         # *** ASSERT ***
@@ -86,10 +157,66 @@ def describe_async_methods():
 
         # *** ACT ***
         result1 = await sut.long_ttl_async()
-        await asyncio.sleep(0.25)
+        await asyncio.sleep(0.02)
         result2 = await sut.long_ttl_async()
 
         # *** ASSERT ***
         assert isinstance(result1, str)
         assert isinstance(result2, str)
         assert result1 == result2
+
+    @pytest.mark.asyncio()
+    async def concurrent_calls_share_one_call():
+        # *** ARRANGE ***
+        sut = HasCache()
+
+        # *** ACT ***
+        results = await asyncio.gather(*(sut.counted_async() for _ in range(5)))
+
+        # *** ASSERT ***
+        assert results == [1, 1, 1, 1, 1]
+        assert sut.calls == 1
+
+    @pytest.mark.asyncio()
+    async def failures_are_not_cached():
+        # *** ARRANGE ***
+        sut = HasCache()
+        sut.fail_first_call = True
+
+        # *** ACT ***
+        with pytest.raises(ValueError, match="first call fails"):
+            await sut.counted_async()
+        result = await sut.counted_async()
+
+        # *** ASSERT ***
+        assert result == 2
+
+    @pytest.mark.asyncio()
+    async def cancelled_calls_are_not_cached():
+        # *** ARRANGE ***
+        sut = HasCache()
+        sut.cancel_first_call = True
+
+        # *** ACT ***
+        with pytest.raises(asyncio.CancelledError):
+            await sut.counted_async()
+        result = await sut.counted_async()
+
+        # *** ASSERT ***
+        assert result == 2
+
+    @pytest.mark.asyncio()
+    async def cancelling_one_caller_does_not_cancel_the_others():
+        # *** ARRANGE ***
+        sut = HasCache()
+        first = asyncio.create_task(sut.long_ttl_async())
+        second = asyncio.create_task(sut.long_ttl_async())
+        await asyncio.sleep(0)
+
+        # *** ACT ***
+        first.cancel()
+        result = await second
+
+        # *** ASSERT ***
+        assert first.cancelled()
+        assert isinstance(result, str)
@@ -0,0 +1,58 @@
+import logging
+from queue import Queue
+
+from utils.log_tools import DroppingQueueHandler, _update_log_handlers
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+
+def describe_dropping_queue_handler():
+    def drops_records_when_queue_is_full():
+        # *** ARRANGE ***
+        queue: Queue[logging.LogRecord] = Queue(maxsize=2)
+        sut = DroppingQueueHandler(queue)
+
+        # *** ACT ***
+        for i in range(5):
+            sut.handle(make_record(f"message {i}"))
+
+        # *** ASSERT ***
+        assert queue.qsize() == 2
+        assert sut.dropped == 3
+
+    def reports_dropped_records_when_queue_has_room():
+        # *** ARRANGE ***
+        queue: Queue[logging.LogRecord] = Queue(maxsize=2)
+        sut = DroppingQueueHandler(queue)
+        for i in range(3):
+            sut.handle(make_record(f"message {i}"))
+        queue.get_nowait()
+        queue.get_nowait()
+
+        # *** ACT ***
+        sut.handle(make_record("message 3"))
+
+        # *** ASSERT ***
+        warning = queue.get_nowait()
+        assert warning.levelno == logging.WARNING
+        assert warning.getMessage() == "1 log records were dropped because the log queue was full"
+        assert queue.get_nowait().getMessage() == "message 3"
+        assert sut.dropped == 0
+
+
+def describe_update_log_handlers():
+    def resets_loggers_and_leaves_placeholders_alone():
+        # *** ARRANGE ***
+        child = logging.getLogger("test_log_tools.parent.child")
+        child.addHandler(logging.NullHandler())
+        child.propagate = False
+
+        # *** ACT ***
+        _update_log_handlers()
+
+        # *** ASSERT ***
+        assert child.handlers == []
+        assert child.propagate is True
+        assert isinstance(logging.root.manager.loggerDict["test_log_tools.parent"], logging.PlaceHolder)
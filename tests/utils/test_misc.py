@@ -0,0 +1,21 @@
+from utils import parse_content_type
+
+
+def describe_parse_content_type():
+    def parses_mime_type_and_params():
+        # *** ACT ***
+        result = parse_content_type("application/json; charset=utf-8")
+
+        # *** ASSERT ***
+        assert result == ("application/json", {"charset": "utf-8"})
+
+    def returns_new_params_for_each_call():
+        # *** ARRANGE ***
+        first = parse_content_type("text/plain; charset=utf-8")
+        first[1]["charset"] = "latin-1"
+
+        # *** ACT ***
+        second = parse_content_type("text/plain; charset=utf-8")
+
+        # *** ASSERT ***
+        assert second[1] == {"charset": "utf-8"}
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+import uvloop
+
+from utils import eager_task_factory
+
+
+def describe_eager_task_factory():
+    @pytest.fixture(params=["asyncio", "uvloop"])
+    def loop(request: pytest.FixtureRequest):
+        loop = asyncio.new_event_loop() if request.param == "asyncio" else uvloop.new_event_loop()
+        loop.set_task_factory(eager_task_factory)
+        yield loop
+        loop.close()
+
+    def completes_tasks_that_do_not_suspend(loop: asyncio.AbstractEventLoop):
+        async def get_value() -> int:
+            return 42
+
+        async def main() -> tuple[bool, int]:
+            task = asyncio.create_task(get_value())
+            return task.done(), await task
+
+        assert loop.run_until_complete(main()) == (True, 42)
+
+    def runs_tasks_that_suspend_on_the_loop(loop: asyncio.AbstractEventLoop):
+        steps: list[str] = []
+
+        async def step(name: str) -> None:
+            steps.append(f"{name} started")
+            await asyncio.sleep(0)
+            steps.append(f"{name} finished")
+
+        async def main() -> None:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(step("one"))
+                tg.create_task(step("two"))
+                steps.append("created")
+
+        loop.run_until_complete(main())
+        assert steps == ["one started", "two started", "created", "one finished", "two finished"]